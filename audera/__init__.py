@@ -35,15 +35,14 @@ DOCS: str = 'https://github.com/thomaseleff/audera/tree/main/docs'
 MDNS_TYPE = f"_{NAME.lower()}._tcp.local."
 STREAM_PORT: int = 5000
 PING_PORT: int = 5001
+RECEIVE_BUFFER_SIZE: int = 4 * 1024 * 1024  # The socket receive buffer size in bytes of the audio stream
+SOCKET_PRIORITY: int = 6  # The Linux socket priority of the audio stream (interactive)
+TYPE_OF_SERVICE: int = 0xB8  # The ip type-of-service of the audio stream (expedited forwarding)
 
 # Synchronization configuration
 SYNC_INTERVAL: int = 600  # The time interval in seconds between time synchonization
 PING_INTERVAL: float = 30  # The time interval in seconds between pings
 
-# Packet configuration
-PACKET_TERMINATOR: bytes = b'\xFF\xFE\xFD\xFC'  # The bytes suffix that indicates the end of a packet
-PACKET_ESCAPE: bytes = b'\x00'  # The bytes escape character to avoid false packet terminator sequences
-
 # Audio playback configuration
 PLAYBACK_DELAY: float = 0.5  # The initial playback delay in seconds
 BUFFER_SIZE: int = 5  # The number of audio packets to buffer before playback
@@ -57,6 +56,9 @@ HIGH_RTT: float = 0.5  # The threshold for identifying high-rtt.
 
 # Orchestration configuration
 TIME_OUT: float = 5  # The general time-out in seconds for network operations
+DEVICE_POLL_INTERVAL: float = 1  # The time interval in seconds between audio interface / device checks
+MIN_DISCOVERY_INTERVAL: float = 0.5  # The initial time interval in seconds between mDNS discovery scans
+MAX_DISCOVERY_INTERVAL: float = 60  # The max. time interval in seconds between mDNS discovery scans
 
 
 # Errors
@@ -4,6 +4,11 @@ from typing import Literal
 import asyncio
 from audera import player, streamer, ui, netifaces
 
+try:
+    import uvloop
+except ImportError:  # The `uvloop` event loop is optional and unavailable on Windows
+    uvloop = None
+
 
 # Define audera sub-command function(s)
 def run(
@@ -54,7 +59,14 @@ def run(
 
     # Run services
     try:
-        asyncio.run(service.run())
+
+        # Run the service within the `uvloop` event loop, when available, for reduced network I / O
+        #   and scheduling overhead
+
+        if uvloop is not None:
+            uvloop.run(service.run())
+        else:
+            asyncio.run(service.run())
 
     except KeyboardInterrupt:
 
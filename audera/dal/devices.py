@@ -33,6 +33,23 @@ def exists(type_: Literal['input', 'output']) -> bool:
         return False
 
 
+def modified(type_: Literal['input', 'output']) -> float:
+    """ Returns the last modification time of the device configuration file in seconds since the epoch,
+    or `0.0` when the device configuration file does not exist.
+
+    Parameters
+    ----------
+    type: `Literal['intput', 'output']`
+        The type of the audio device.
+    """
+    if exists(type_):
+        return os.path.getmtime(
+            os.path.abspath(os.path.join(PATH, '%s_device.json' % type_))
+        )
+    else:
+        return 0.0
+
+
 def create(type_: Literal['input', 'output']) -> config.Handler:
     """ Creates the device configuration file and returns the contents
     as a `pytensils.config.Handler` object.
@@ -30,6 +30,18 @@ def exists() -> bool:
         return False
 
 
+def modified() -> float:
+    """ Returns the last modification time of the interface configuration file in seconds since the epoch,
+    or `0.0` when the interface configuration file does not exist.
+    """
+    if exists():
+        return os.path.getmtime(
+            os.path.abspath(os.path.join(PATH, FILE_NAME))
+        )
+    else:
+        return 0.0
+
+
 def create() -> config.Handler:
     """ Creates the interface configuration file and returns the contents
     as a `pytensils.config.Handler` object.
@@ -46,6 +46,28 @@ def exists(uuid: str) -> bool:
         return False
 
 
+def modified(uuid: str) -> float:
+    """ Returns the last modification time of the player configuration file in seconds since the epoch,
+    or `0.0` when the player configuration file does not exist.
+
+    Parameters
+    ----------
+    uuid: `str`
+        A unique universal identifier of an `audera.struct.player.Player` object.
+    """
+    if exists(uuid):
+        return os.path.getmtime(
+            os.path.abspath(
+                os.path.join(
+                    PATH,
+                    '.'.join([uuid, 'json'])
+                )
+            )
+        )
+    else:
+        return 0.0
+
+
 def create(identity_: identity.Identity) -> config.Handler:
     """ Creates the player configuration file from a player identity
     and returns the contents as a `pytensils.config.Handler` object.
@@ -1,15 +1,18 @@
 """ Audio I / O device manager """
 
 from __future__ import annotations
+from typing import Union
 import logging
 import asyncio
 import time
-import struct
+import math
 import copy
 import json
+import collections
 import pyaudio
 
 from audera import struct as struct_
+from audera import platform
 
 
 class Input():
@@ -17,27 +20,53 @@ class Input():
 
     Parameters
     ----------
+    logger: `audera.logging.Logger`
+        An instance of `audera.logging.Logger`.
     interface: `audera.struct.audio.Interface`
         An `audera.struct.audio.Interface` object.
     device: `audera.struct.audio.Device`
         An `audera.struct.audio.Device` object that represents an audio input.
+    buffer_size: `int`
+        The max. number of captured audio data chunks to buffer before broadcasting.
     """
 
     def __init__(
         self,
+        logger: logging.Logger,
         interface: struct_.audio.Interface,
-        device: struct_.audio.Device
+        device: struct_.audio.Device,
+        buffer_size: int = 5
     ):
         """ Initializes an instance of an audio device input.
 
         Parameters
         ----------
+        logger: `audera.logging.Logger`
+            An instance of `audera.logging.Logger`.
         interface: `audera.struct.audio.Interface`
             An `audera.struct.audio.Interface` object.
         device: `audera.struct.audio.Device`
             An `audera.struct.audio.Device` object that represents an audio input.
+        buffer_size: `int`
+            The max. number of captured audio data chunks to buffer before broadcasting.
         """
 
+        # Logging
+        self.logger = logger
+
+        # Initialize the audio buffer
+
+        # The buffer is written by the audio capture thread and read by the event loop, as tuples
+        #   of the capture time and the audio data chunk. When the event loop falls behind, the
+        #   oldest audio data chunks are dropped.
+
+        self.buffer: collections.deque = collections.deque(maxlen=buffer_size)
+        self.event: asyncio.Event = asyncio.Event()
+        self.loop: Union[asyncio.AbstractEventLoop, None] = None
+
+        # Initialize the realtime scheduling state of the audio capture thread
+        self.realtime: bool = False
+
         # Initialize the audio stream
         self.interface: struct_.audio.Interface = interface
         self.device: struct_.audio.Device = device
@@ -48,8 +77,10 @@ class Input():
             channels=interface.channels,
             frames_per_buffer=interface.chunk,
             input=True,
-            input_device_index=device.index
+            input_device_index=device.index,
+            stream_callback=self.audio_capture_callback
         )
+        self.verify_chunk()
 
     def to_dict(self):
         """ Returns the `audera.struct.audio.Input` object as a `dict`. """
@@ -117,20 +148,130 @@ class Input():
             if not self.device == device:
                 self.device = copy.deepcopy(device)
 
-            # Open a new audio stream with the latest settings
+            # Open a new audio stream with the latest settings, elevating the audio capture thread
+            #   of the new audio stream
+            self.buffer.clear()
+            self.realtime = False
             self.stream = self.port.open(
                 format=self.interface.format,
                 rate=self.interface.rate,
                 channels=self.interface.channels,
                 frames_per_buffer=self.interface.chunk,
                 input=True,
-                input_device_index=self.device.index
+                input_device_index=self.device.index,
+                stream_callback=self.audio_capture_callback
             )
+            self.verify_chunk()
 
             return True
         else:
             return False
 
+    def verify_chunk(self) -> bool:
+        """ Returns `True` when the audio data chunk size covers the default low input latency of the
+        audio input device, otherwise logs the suggested audio data chunk size and returns `False`.
+
+        The audio data chunk size is shared with the remote audio output players and is therefore
+        not changed at runtime, audio data chunks smaller than the device block size lead to buffer
+        overruns of the audio capture stream.
+        """
+        try:
+            latency = self.port.get_device_info_by_index(self.device.index)['defaultLowInputLatency']
+        except (IOError, KeyError, TypeError):
+            return True
+
+        frames = latency * self.interface.rate
+        if self.interface.chunk >= frames:
+            return True
+
+        # Logging
+        self.logger.warning(
+            'The audio data chunk {%d} is smaller than the block size {%d} of the audio input device'
+            ' {%s (%s)}, use a chunk of at least {%d} to avoid buffer overruns.',
+            self.interface.chunk,
+            round(frames),
+            self.device.name,
+            self.device.index,
+            1 << max(0, math.ceil(frames) - 1).bit_length()
+        )
+        return False
+
+    def audio_capture_callback(
+        self,
+        in_data: bytes,
+        frame_count: int,
+        time_info: dict,
+        status: int
+    ) -> tuple[None, int]:
+        """ Adds the captured audio data chunk and its capture time to the capture buffer and wakes
+        the event loop.
+
+        Parameters
+        ----------
+        in_data: `bytes`
+            The audio data chunk as bytes.
+        frame_count: `int`
+            The number of frames in the audio data chunk.
+        time_info: `dict`
+            A dictionary containing the current time and the input buffer time.
+        status: `int`
+            The status of the audio stream.
+        """
+
+        # Elevate the audio capture thread to realtime priority to avoid buffer overruns when
+        #   the event loop thread is busy
+
+        if not self.realtime:
+            self.realtime = True
+            if not platform.set_realtime_priority():
+
+                # Logging
+                self.logger.warning(
+                    ' '.join([
+                        'The audio capture thread is unable to operate with realtime priority.',
+                        platform.REALTIME_PRIORITY_HINT
+                    ])
+                )
+
+        # Convert the capture time of the first frame of the audio data chunk from the audio stream
+        #   clock to the local machine time, falling back to the current time when the host api does
+        #   not report the stream timing
+
+        now = time.time()
+        latency = time_info['current_time'] - time_info['input_buffer_adc_time']
+        self.buffer.append((now - latency if 0.0 < latency < 1.0 else now, in_data))
+
+        # Wake the event loop, unless the event loop has since been closed, the event is only ever
+        #   set from the event loop thread
+        if self.loop is not None:
+            try:
+                self.loop.call_soon_threadsafe(self.event.set)
+            except RuntimeError:
+                pass
+
+        return (None, pyaudio.paContinue)
+
+    async def read(self) -> tuple[float, bytes]:
+        """ Returns the capture time and the next audio data chunk from the capture buffer, waiting
+        until the audio data chunk is captured.
+        """
+        self.loop = asyncio.get_running_loop()
+        while not self.buffer:
+            self.event.clear()
+            await self.event.wait()
+        return self.buffer.popleft()
+
+    def stop(self):
+        """ Stops the audio capture stream. """
+
+        # Stop the audio stream
+        if self.stream.is_active():
+            self.stream.stop_stream()
+
+        # Close the audio services
+        self.stream.close()
+        self.port.terminate()
+
 
 class Output():
     """ A `class` that represents an audio device output.
@@ -144,9 +285,9 @@ class Output():
     device: `audera.struct.audio.Device`
         An `audera.struct.audio.Device` object that represents an audio output.
     buffer_size: `int`
-        The number of audio packets to buffer before playback.
+        The max. number of audio packets to buffer before playback.
     time_offset: `float`
-        The time offset in seconds between the local time on the remote audio
+        The time offset in seconds between the local monotonic time on the remote audio
         output player and the audio streamer for synchronizing the audio playback stream.
     """
 
@@ -169,9 +310,9 @@ class Output():
         device: `audera.struct.audio.Device`
             An `audera.struct.audio.Device` object that represents an audio output.
         buffer_size: `int`
-            The number of audio packets to buffer before playback.
+            The max. number of audio packets to buffer before playback.
         time_offset: `float`
-            The time offset in seconds between the local time on the remote audio
+            The time offset in seconds between the local monotonic time on the remote audio
                 output player and the audio streamer for synchronizing the audio playback stream.
         """
 
@@ -193,9 +334,18 @@ class Output():
         )
 
         # Initialize the audio buffer and time offset
-        self.buffer: asyncio.Queue = asyncio.Queue(buffer_size)
+
+        # The buffer is written by the event loop and read by the audio playback thread, as tuples
+        #   of the playback time and the audio data chunk. A `collections.deque` supports
+        #   thread-safe appends and pops without the locks and futures of an `asyncio.Queue`.
+
+        self.buffer: collections.deque = collections.deque()
+        self.buffer_size: int = buffer_size
         self.time_offset: float = time_offset
 
+        # Initialize the realtime scheduling state of the audio playback thread
+        self.realtime: bool = False
+
     @property
     def chunk_length(self) -> int:
         """ The number of bytes in the audio data chunk. """
@@ -296,6 +446,12 @@ class Output():
                 stream_callback=self.audio_playback_callback
             )
 
+            # Elevate the audio playback thread of the new audio stream
+            self.realtime = False
+
+            # Reset the buffer for the new audio data chunk length
+            self.buffer.clear()
+
             return True
         else:
             return False
@@ -307,8 +463,7 @@ class Output():
         time_info: dict,
         status: int
     ) -> tuple[bytes, int]:
-        """ Returns the next audio stream packet from the playback buffer, discarding incomplete
-        or late packets.
+        """ Returns the next audio stream packet from the playback buffer, discarding late packets.
 
         Parameters
         ----------
@@ -322,72 +477,73 @@ class Output():
             The status of the audio stream.
         """
 
-        # Calculate the digital-to-analog converter (dac) offset
-        current_time = time.time()
-        dac_offset = current_time - time_info['current_time']
-
-        # Convert the digital-to-analog converter output time to local-time
-        dac_playback_time = time_info['output_buffer_dac_time'] + dac_offset
-
-        # Discard invalid packets
-        while not self.buffer.empty():
-
-            # Peak at the next audio stream packet from the buffer queue
-            next_packet = self.buffer._queue[0]
-
-            # Peak at the playback time and length of the next packet
-            playback_time = struct.unpack("d", next_packet[4:12])[0]
-            length = struct.unpack(">I", next_packet[:4])[0]
+        # Elevate the audio playback thread to realtime priority and pin it to a single cpu to
+        #   avoid buffer underruns when the event loop thread is busy
 
-            # Discard incomplete packets
-            if length != self.chunk_length:
+        if not self.realtime:
+            self.realtime = True
+            if not platform.set_realtime_priority():
 
                 # Logging
                 self.logger.warning(
-                    'Incomplete packet with playback time %.7f [sec.].' % (
-                        playback_time
-                    )
+                    ' '.join([
+                        'The audio playback thread is unable to operate with realtime priority.',
+                        platform.REALTIME_PRIORITY_HINT
+                    ])
                 )
 
-                # Remove the incomplete packet from the buffer queue
-                _ = self.buffer.get_nowait()
+            # Pin the audio playback thread to a single cpu to avoid migration jitter
+            platform.set_cpu_affinity()
 
-                continue
+        # Calculate the digital-to-analog converter (dac) offset from the monotonic clock
+        #   used for time synchronization with the audio streamer
+        current_time = time.monotonic()
+        dac_offset = current_time - time_info['current_time']
+
+        # Convert the digital-to-analog converter output time to local-time
+        dac_playback_time = time_info['output_buffer_dac_time'] + dac_offset
 
-            # Calculate the target playback time in the player local time
-            target_playback_time = playback_time - self.time_offset
+        # Convert the digital-to-analog converter output time to the audio streamer time once
+        #   per callback, so that each packet playback time is compared as-is
+        deadline = dac_playback_time + self.time_offset
 
-            # Discard late packets
-            if target_playback_time < dac_playback_time:
+        # Count the late packets discarded within the callback
+        late = 0
 
-                # Logging
-                self.logger.warning(
-                    'Late packet %.7f [sec.] with playback time %.7f [sec.].' % (
-                        target_playback_time - dac_playback_time,
-                        playback_time
-                    )
-                )
+        try:
 
-                # Remove the late packet from the buffer queue
-                _ = self.buffer.get_nowait()
+            # Discard late packets, incomplete packets are discarded by the audio receiver
+            while True:
 
-                continue
+                # Peak at the next audio stream packet from the buffer
+                next_packet = self.buffer[0]
 
-            # Exit the loop only when a valid packet is available
-            break
+                # Discard late packets in bulk, from the playback time alone, to catch-up with
+                #   the audio playback stream
+                if next_packet[0] < deadline:
+                    self.buffer.popleft()
+                    late += 1
+                    continue
 
-        # Get the next audio stream packet from the buffer queue
-        try:
-            packet = self.buffer.get_nowait()
+                # Exit the loop only when a valid packet is available
+                break
 
-            # Parse the playback time and audio data from the packet
-            playback_time = struct.unpack("d", packet[4:12])[0]
-            chunk = packet[12:-12]
+            # Get the next audio data chunk from the buffer, the audio data chunk is buffered as
+            #   `bytes`, the only audio data type PyAudio accepts from the callback
+            _, chunk = self.buffer.popleft()
 
-        # Create a silent audio stream chunk when the buffer queue is empty
-        except asyncio.QueueEmpty:
+        # Create a silent audio stream chunk when the buffer is empty
+        except IndexError:
             chunk = self.silent_chunk
 
+        if late:
+
+            # Logging
+            self.logger.warning(
+                'Discarded %d late packet(s) behind the audio playback stream.',
+                late
+            )
+
         # Return the audio stream chunk
         return (chunk, pyaudio.paContinue)
 
@@ -398,11 +554,7 @@ class Output():
 
     def clear_buffer(self):
         """ Clears any / all unplayed audio stream packets from the buffer. """
-        while not self.buffer.empty():
-            try:
-                self.buffer.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self.buffer.clear()
 
     def stop(self):
         """ Stops the audio playback stream. """
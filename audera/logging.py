@@ -63,74 +63,107 @@ class logger():
         """ Returns the logger instance. """
         return self.logger
 
-    def message(self, message: str):
+    def message(self, message: str, *args):
         """ Logs message with an un-set severity.
 
         Parameters
         ----------
         message: `str`
             The log-message content.
+        *args
+            The arguments merged into the log-message content with `%`-formatting only
+                when the log-message is emitted.
         """
-        self.logger.info(f"{message}")
+        self.logger.info(f"{message}", *args)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """ Logs message with severity `DEBUG`.
 
         Parameters
         ----------
         message: `str`
             The log-message content.
+        *args
+            The arguments merged into the log-message content with `%`-formatting only
+                when the log-message is emitted.
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(
-            f"{COLORS['blue']}    DEBUG: {message}{RESET}"
+            f"{COLORS['blue']}    DEBUG: {message}{RESET}",
+            *args
         )
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """ Logs message with severity `INFO`.
 
         Parameters
         ----------
         message: `str`
             The log-message content.
+        *args
+            The arguments merged into the log-message content with `%`-formatting only
+                when the log-message is emitted.
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
-            f"    INFO: {message}"
+            f"    INFO: {message}",
+            *args
         )
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """ Logs message with severity `WARNING`.
 
         Parameters
         ----------
         message: `str`
             The log-message content.
+        *args
+            The arguments merged into the log-message content with `%`-formatting only
+                when the log-message is emitted.
         """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         self.logger.warning(
-            f"{COLORS['yellow']}  * WARNING: {message}{RESET}"
+            f"{COLORS['yellow']}  * WARNING: {message}{RESET}",
+            *args
         )
 
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """ Logs message with severity `ERROR`.
 
         Parameters
         ----------
         message: `str`
             The log-message content.
+        *args
+            The arguments merged into the log-message content with `%`-formatting only
+                when the log-message is emitted.
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         self.logger.error(
-            f"{COLORS['red']} ** ERROR: {message}{RESET}"
+            f"{COLORS['red']} ** ERROR: {message}{RESET}",
+            *args
         )
 
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """ Logs message with severity `CRITICAL`.
 
         Parameters
         ----------
         message: `str`
             The log-message content.
+        *args
+            The arguments merged into the log-message content with `%`-formatting only
+                when the log-message is emitted.
         """
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
         self.logger.critical(
-            f"{COLORS['bold_red']}*** CRITICAL: {message}{RESET}"
+            f"{COLORS['bold_red']}*** CRITICAL: {message}{RESET}",
+            *args
         )
 
 
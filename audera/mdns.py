@@ -6,9 +6,10 @@ that do not include a local name server.
 
 from typing import Union, Dict
 import logging
+import asyncio
 import socket
 from zeroconf import Zeroconf, ServiceInfo, ServiceBrowser, ServiceStateChange
-from threading import Event
+from zeroconf.asyncio import AsyncZeroconf
 
 from audera import struct, dal
 
@@ -21,8 +22,6 @@ class PlayerBroadcaster():
     ----------
     logger: `audera.logging.Logger`
         An instance of `audera.logging.Logger`.
-    zc: `zeroconf.Zeroconf`
-        An instance of the `zeroconf` multi-cast DNS service.
     player: `audera.struct.player.Player`
         An `audera.struct.player.Player` object.
     service_type: `str`
@@ -31,16 +30,19 @@ class PlayerBroadcaster():
         The description of the mDNS service.
     service_port: `int`
         The mDNS service broadcast port.
+    zc: `zeroconf.asyncio.AsyncZeroconf`
+        An instance of the async `zeroconf` multi-cast DNS service. When `None`, the service
+            is created within the running event loop upon registration.
     """
 
     def __init__(
         self,
         logger: logging.Logger,
-        zc: Zeroconf,
         player: struct.player.Player,
         service_type: str,
         service_description: str,
-        service_port: int
+        service_port: int,
+        zc: Union[AsyncZeroconf, None] = None
     ):
         """ Creates an instance of the multi-cast DNS service broadcaster.
 
@@ -48,8 +50,6 @@ class PlayerBroadcaster():
         ----------
         logger: `audera.logging.Logger`
             An instance of `audera.logging.Logger`.
-        zc: `zeroconf.Zeroconf`
-            An instance of the `zeroconf` multi-cast DNS service.
         player: `audera.struct.player.Player`
             An `audera.struct.player.Player` object.
         service_type: `str`
@@ -58,31 +58,48 @@ class PlayerBroadcaster():
             The description of the mDNS service.
         service_port: `int`
             The mDNS service broadcast port.
+        zc: `zeroconf.asyncio.AsyncZeroconf`
+            An instance of the async `zeroconf` multi-cast DNS service. When `None`, the service
+                is created within the running event loop upon registration.
         """
 
         # Logging
         self.logger = logger
 
         # Initialize mDNS
-        self.zc: Zeroconf = zc
+        self.zc: Union[AsyncZeroconf, None] = zc
         self.player: struct.player.Player = player
         self.service_type: str = service_type
         self.service_description: str = service_description
         self.service_port: int = service_port
 
+        # Initialize the service information cache
+        self._info: Union[ServiceInfo, None] = None
+        self._info_key: Union[tuple, None] = None
+
     @property
     def info(self) -> ServiceInfo:
-        """ Returns a `zeroconf.ServiceInfo` object from the `audera.struct.player.Player` object. """
-        return ServiceInfo(
-            type_=self.service_type,
-            name=self.registered_name,
-            server=self.registered_name,
-            addresses=[socket.inet_aton(self.player.address)],
-            port=self.service_port,
-            weight=0,
-            priority=0,
-            properties={**self.player.to_dict(), **{"description": self.service_description}}
-        )
+        """ Returns a `zeroconf.ServiceInfo` object from the `audera.struct.player.Player` object. The
+        service information, including the encoded TXT-record properties, is only re-built when the
+        attributes of the player change.
+        """
+        properties = {**self.player.to_dict(), **{"description": self.service_description}}
+        key = tuple(properties.items())
+
+        if self._info is None or self._info_key != key:
+            self._info = ServiceInfo(
+                type_=self.service_type,
+                name=self.registered_name,
+                server=self.registered_name,
+                addresses=[socket.inet_aton(self.player.address)],
+                port=self.service_port,
+                weight=0,
+                priority=0,
+                properties=properties
+            )
+            self._info_key = key
+
+        return self._info
 
     @property
     def registered_name(self) -> str:
@@ -97,8 +114,12 @@ class PlayerBroadcaster():
 
         try:
 
-            # Register the mDNS service
-            self.zc.register_service(info=self.info)
+            # Create the async mDNS service within the running event loop
+            if self.zc is None:
+                self.zc = AsyncZeroconf()
+
+            # Register the mDNS service, waiting for the service announcement to complete
+            await (await self.zc.async_register_service(info=self.info))
 
             # Connect the remote audio output player
             self.player = dal.players.connect(self.player.uuid)
@@ -123,7 +144,7 @@ class PlayerBroadcaster():
                 )
             )
 
-    def update(
+    async def update(
         self,
         player: struct.player.Player
     ):
@@ -140,7 +161,9 @@ class PlayerBroadcaster():
         if not self.player == player:
             try:
                 self.player = player
-                self.zc.update_service(self.info)
+
+                # Update the mDNS service, waiting for the service announcement to complete
+                await (await self.zc.async_update_service(self.info))
 
                 # Connect the remote audio output player
                 self.player = dal.players.connect(self.player.uuid)
@@ -165,13 +188,13 @@ class PlayerBroadcaster():
                     )
                 )
 
-    def unregister(self):
+    async def unregister(self):
         """ Unregisters the mDNS service and disconnects the remote audio output player from the local network. """
         if self.zc and self.player:
 
             # Exit
-            self.zc.unregister_service(self.info)
-            self.zc.close()
+            await (await self.zc.async_unregister_service(self.info))
+            await self.zc.async_close()
 
             # Disconnect the remote audio output player
             self.player = dal.players.disconnect(self.player.uuid)
@@ -329,9 +352,17 @@ class PlayerBrowser():
         self.type_: str = type_
 
         # Initialize timeout parameters
-        self.delay: Event = Event()
         self.time_out: float = time_out
 
+        # Initialize the change event
+
+        # The service browser calls back on the `zeroconf` thread, so changes to the remote audio
+        #   output players wake the event loop of the browser through the change event rather than
+        #   waiting for the next poll.
+
+        self.event: asyncio.Event = asyncio.Event()
+        self.loop: Union[asyncio.AbstractEventLoop, None] = None
+
         # Initialize remote audio output players
         self.players: Dict[str, Union[ServiceInfo, None]] = {}
 
@@ -340,6 +371,7 @@ class PlayerBrowser():
 
     async def browse(self):
         """ Browses for the remote audio output player mDNS service within the local network. """
+        self.loop = asyncio.get_running_loop()
 
         # Logging
         self.logger.info(
@@ -378,10 +410,11 @@ class PlayerBrowser():
             The browser state of the remote audio output player.
         """
 
-        # Connect remote audio output player
-        if state_change == ServiceStateChange.Added:
+        # Connect remote audio output player, requesting and decoding the service information only
+        #   for remote audio output players that are not already connected
+        if state_change == ServiceStateChange.Added and name not in self.players:
             info = zeroconf.get_service_info(service_type, name)
-            if info and (name not in self.players):
+            if info:
 
                 player: struct.player.Player = struct.player.Player.from_service_info(info)
                 player.connected = True
@@ -430,6 +463,29 @@ class PlayerBrowser():
                     )
                 )
 
+        # Wake the event loop of the browser, unless the event loop has since been closed
+        if self.loop is not None:
+            try:
+                self.loop.call_soon_threadsafe(self.event.set)
+            except RuntimeError:
+                pass
+
+    async def wait(self, time_out: float) -> bool:
+        """ Waits until the remote audio output players change or the time-out elapses and returns
+        `True` when the remote audio output players changed.
+
+        Parameters
+        ----------
+        time_out: `float`
+            The time-out in seconds to wait for a change.
+        """
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout=time_out)
+        except asyncio.TimeoutError:
+            return False
+        self.event.clear()
+        return True
+
     def refresh(self):
         """ Refresh the mDNS service browser. """
 
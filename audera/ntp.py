@@ -1,9 +1,46 @@
 """ Network time protocol (ntp) synchronizer """
 
 from typing import Union, Literal
+import asyncio
+import socket
+import time
 import ntplib
 
 
+class Protocol(asyncio.DatagramProtocol):
+    """ A `class` that represents the datagram protocol of a network time protocol client, resolving
+    the pending request with the next response from the network time protocol server.
+    """
+
+    def __init__(self):
+        """ Creates an instance of the network time protocol client datagram protocol. """
+        self.response: Union[asyncio.Future, None] = None
+
+    def datagram_received(self, data: bytes, addr: tuple):
+        """ Resolves the pending request with the response packet.
+
+        Parameters
+        ----------
+        data: `bytes`
+            The response packet of the network time protocol server.
+        addr: `tuple`
+            The address of the network time protocol server.
+        """
+        if self.response is not None and not self.response.done():
+            self.response.set_result(data)
+
+    def error_received(self, exc: Exception):
+        """ Fails the pending request.
+
+        Parameters
+        ----------
+        exc: `Exception`
+            The socket error of the network time protocol client.
+        """
+        if self.response is not None and not self.response.done():
+            self.response.set_exception(exc)
+
+
 class Synchronizer:
     """ A `class` that represents a network time protocol server. """
     def __init__(
@@ -24,13 +61,94 @@ class Synchronizer:
         self.port = port
         self.client = ntplib.NTPClient()
 
+        # The resolved address of the network time protocol server, retained so that only the
+        #   first request, or the first request after a failed request, resolves the server name
+        self.address: Union[str, None] = None
+
+        # The datagram endpoint of the async network time protocol client, retained so that the
+        #   same socket is reused for every request until a request fails
+        self.transport: Union[asyncio.DatagramTransport, None] = None
+        self.protocol: Union[Protocol, None] = None
+
     def sync(self) -> ntplib.NTPStats:
         """ Returns the current time statistics from the network time protocol server.
         """
-        return self.client.request(self.server, version=3, port=self.port)
+        try:
+            if self.address is None:
+                self.address = socket.gethostbyname(self.server)
+            return self.client.request(self.address, version=3, port=self.port)
+        except (ntplib.NTPException, OSError):
+            self.address = None
+            raise
 
     def offset(self) -> float:
         """ Reterns the offset between the network time protocol server and the local machine time.
         """
         response = self.sync()
         return response.offset
+
+    async def async_sync(self, time_out: float = 5) -> ntplib.NTPStats:
+        """ Returns the current time statistics from the network time protocol server without blocking
+        the event loop.
+
+        Parameters
+        ----------
+        time_out: `float`
+            The time-out in seconds of the request.
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+
+            # Open the datagram endpoint, resolving the server name when no address is retained
+            if self.transport is None or self.transport.is_closing():
+                if self.address is None:
+                    self.address = (
+                        await loop.getaddrinfo(self.server, self.port, type=socket.SOCK_DGRAM)
+                    )[0][4][0]
+                self.transport, self.protocol = await loop.create_datagram_endpoint(
+                    Protocol,
+                    remote_addr=(self.address, self.port)
+                )
+
+            # Request the time statistics
+            self.protocol.response = loop.create_future()
+            request = ntplib.NTPPacket(
+                mode=3,
+                version=3,
+                tx_timestamp=ntplib.system_to_ntp_time(time.time())
+            )
+            self.transport.sendto(request.to_data())
+            data = await asyncio.wait_for(self.protocol.response, timeout=time_out)
+            dest_timestamp = ntplib.system_to_ntp_time(time.time())
+
+        except (asyncio.TimeoutError, OSError) as e:
+            self.close()
+            self.address = None
+            raise ntplib.NTPException(
+                'No response received from %s.' % self.server
+            ) from e
+
+        response = ntplib.NTPStats()
+        response.from_data(data)
+        response.dest_timestamp = dest_timestamp
+        return response
+
+    async def async_offset(self, time_out: float = 5) -> float:
+        """ Returns the offset between the network time protocol server and the local machine time
+        without blocking the event loop.
+
+        Parameters
+        ----------
+        time_out: `float`
+            The time-out in seconds of the request.
+        """
+        response = await self.async_sync(time_out=time_out)
+        return response.offset
+
+    def close(self):
+        """ Closes the datagram endpoint of the async network time protocol client. """
+        if self.transport is not None:
+            self.transport.close()
+        self.transport = None
+        self.protocol = None
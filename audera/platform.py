@@ -2,6 +2,7 @@
 
 from typing import Callable, Literal
 import os
+import ctypes
 import dotenv
 import platform
 
@@ -15,6 +16,59 @@ VERSION = '.'.join([
     os.getenv('G_DIETPI_VERSION_RC', '0')
 ]) if os.getenv('G_DIETPI_VERSION_CORE') else platform.version().strip().lower()
 
+# Audio thread scheduling
+REALTIME_PRIORITY: int = 20  # The `SCHED_FIFO` priority of the audio threads on Linux
+THREAD_PRIORITY_TIME_CRITICAL: int = 15  # The thread priority of the audio threads on Windows
+REALTIME_PRIORITY_HINT: str = ' '.join([
+    'On Linux, allow the realtime priority for the user running `audera` with an `rtprio` limit in',
+    '`/etc/security/limits.d/audera.conf` (e.g. `<user> - rtprio %s`), or with `LimitRTPRIO=%s`' % (
+        REALTIME_PRIORITY,
+        REALTIME_PRIORITY
+    ),
+    'in the systemd unit of the `audera` service.'
+])  # The hint for enabling the realtime priority of the audio threads
+
+
+def set_realtime_priority(priority: int = REALTIME_PRIORITY) -> bool:
+    """ Elevates the calling thread to the `SCHED_FIFO` realtime scheduling policy and returns
+    `True` when successful. The realtime scheduling policy is only available on Linux and requires
+    either root or an `RLIMIT_RTPRIO` limit of at least the priority, see `REALTIME_PRIORITY_HINT`.
+    On Windows, the calling thread is elevated to the time-critical thread priority instead.
+
+    Parameters
+    ----------
+    priority: `int`
+        The realtime priority of the calling thread.
+    """
+    if NAME == 'windows':
+        kernel32 = ctypes.windll.kernel32
+        return bool(
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_TIME_CRITICAL)
+        )
+
+    if not hasattr(os, 'sched_setscheduler'):
+        return False
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+def set_cpu_affinity() -> bool:
+    """ Pins the calling thread to the last available cpu, away from the cpu that typically services
+    hardware interrupts, and returns `True` when successful. Cpu affinity is only available on Linux.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return False
+
+    try:
+        os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+        return True
+    except (OSError, ValueError):
+        return False
+
 
 # Decorator function(s)
 def requires(
@@ -1,12 +1,26 @@
 """ Player service """
 
+from typing import Union, Set
 import asyncio
+import socket
 import time
 import struct
-from zeroconf import Zeroconf
+import concurrent.futures
+
+try:
+    from dbus_next import BusType
+    from dbus_next.aio import MessageBus
+    from dbus_next.errors import DBusError
+except ImportError:  # The `dbus-next` systemd integration is optional
+    MessageBus = None
 
 import audera
 
+# Packet structures
+_LENGTH = struct.Struct(">I")  # The length of the audio data chunk, 4 bytes
+_TIME = struct.Struct("d")  # The time synchronization request, 8 bytes
+_TIMES = struct.Struct("!dd")  # The time synchronization response, 16 bytes
+
 
 class Service():
     """ A `class` that represents the `audera` remote audio output player service.
@@ -39,6 +53,66 @@ class Service():
         # Logging
         self.logger = audera.logging.get_player_logger()
 
+        # Initialize playback session
+
+        # The player supports only a single active playback session at a time. When a new streamer
+        #   connects, the player automatically disconnects and closes the previous playback
+        #   session.
+
+        self.playback_session: audera.sessions.Playback = audera.sessions.Playback()
+
+        # Initialize the identity, player, mDNS and audio stream playback
+
+        # The identity, player and mDNS broadcaster are initialized by the `initialize` method and
+        #   the audio stream playback is initialized by the `audio_output_initializer` service, so
+        #   that network interface enumeration, configuration-layer reads / writes and the audio
+        #   output device probing do not delay the start of the event loop.
+
+        self.identity: Union[audera.struct.identity.Identity, None] = None
+        self.player: Union[audera.struct.player.Player, None] = None
+        self.mdns: Union[audera.mdns.PlayerBroadcaster, None] = None
+        self.audio_output: Union[audera.devices.Output, None] = None
+
+        # Initialize the audio executor
+
+        # Opening, updating, starting and stopping the audio stream are blocking PortAudio calls that
+        #   can wait on the audio output device. All of them run on a single dedicated thread, so
+        #   that the event loop is never blocked by the audio output device and PortAudio is only
+        #   ever called from the same thread. The thread runs with normal priority, only the
+        #   PortAudio callback thread of the audio stream is elevated to realtime priority.
+
+        self.audio_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='audera-audio'
+        )
+
+        # Initialize time synchronization
+        self.rtt: float = 0.0
+
+        # Initialize the audio streamer synchronizer and audio receiver servers
+        self.streamer_synchronizer_server: Union[asyncio.Server, None] = None
+        self.audio_receiver_server: Union[asyncio.Server, None] = None
+
+        # Initialize the playback session tasks
+
+        # The audio stream connections attach to and close the playback session from protocol
+        #   callbacks, which cannot await. The event loop only holds weak references to tasks, so
+        #   the tasks are retained until they complete and any exception is logged.
+
+        self.playback_session_tasks: Set[asyncio.Task] = set()
+
+        # Initialize process control parameters
+        self.mdns_broadcaster_event: asyncio.Event = asyncio.Event()
+        self.audio_output_event: asyncio.Event = asyncio.Event()
+        self.sync_event: asyncio.Event = asyncio.Event()
+        self.buffer_event: asyncio.Event = asyncio.Event()
+
+    async def initialize(self):
+        """ Initializes the identity, player and mDNS broadcaster of the `audera` player service,
+        running the blocking network interface enumeration and configuration-layer reads / writes
+        outside of the event loop.
+        """
+
         # Initialize identity
 
         # The `update` method will either get the existing identity, create a new identity or
@@ -48,9 +122,10 @@ class Service():
         #   ip-address. Finally, the name and uuid of an identity are immutable, when an identity is updated
         #   the same name and uuid are always retained.
 
-        self.mac_address = audera.netifaces.get_local_mac_address()
-        self.player_ip_address = audera.netifaces.get_local_ip_address()
-        self.identity: audera.struct.identity.Identity = audera.dal.identities.update(
+        self.mac_address = await asyncio.to_thread(audera.netifaces.get_local_mac_address)
+        self.player_ip_address = await asyncio.to_thread(audera.netifaces.get_local_ip_address)
+        self.identity = await asyncio.to_thread(
+            audera.dal.identities.update,
             audera.struct.identity.Identity(
                 name=audera.struct.identity.generate_cool_name(),
                 uuid=audera.struct.identity.generate_uuid_from_mac_address(self.mac_address),
@@ -64,30 +139,28 @@ class Service():
         # The `update` method will either get the existing player, create a new player or
         #   update an existing player from the identity.
 
-        self.player: audera.struct.player.Player = audera.dal.players.update_identity(self.identity)
-
-        # Initialize playback session
-
-        # The player supports only a single active playback session at a time. When a new streamer
-        #   connects, the player automatically disconnects and closes the previous playback
-        #   session.
-
-        self.playback_session: audera.sessions.Playback = audera.sessions.Playback()
+        self.player = await asyncio.to_thread(audera.dal.players.update_identity, self.identity)
 
         # Initialize mDNS
 
         # The player broadcasts the `audera` mDNS service, `raop@{mac_address}._audera._tcp.local`,
         #   over the network. The broadcast properties include all the attributes of the player.
 
-        self.mdns: audera.mdns.PlayerBroadcaster = audera.mdns.PlayerBroadcaster(
+        self.mdns = audera.mdns.PlayerBroadcaster(
             logger=self.logger,
-            zc=Zeroconf(),
             player=self.player,
             service_type=audera.MDNS_TYPE,
             service_description=audera.DESCRIPTION,
             service_port=audera.STREAM_PORT
         )
 
+    async def audio_output_initializer(self):
+        """ The async `micro-service` that initializes the audio stream playback outside of the event
+        loop, allowing the mDNS broadcaster to start while the audio output device is opened.
+
+        The audio streamer synchronizer depends on the audio output initializer.
+        """
+
         # Initialize audio stream playback
 
         # The `get-interface` and `get-device` methods will either get the existing audio
@@ -97,20 +170,18 @@ class Service():
         #   chunk). The device determines which hardware output device is playing the audio
         #   stream. The system default audio output device is automatically selected.
 
-        self.audio_output = audera.devices.Output(
-            logger=self.logger,
-            interface=audera.dal.interfaces.get_interface(),
-            device=audera.dal.devices.get_device('output'),
-            buffer_size=audera.BUFFER_SIZE
+        self.audio_output = await asyncio.get_running_loop().run_in_executor(
+            self.audio_executor,
+            lambda: audera.devices.Output(
+                logger=self.logger,
+                interface=audera.dal.interfaces.get_interface(),
+                device=audera.dal.devices.get_device('output'),
+                buffer_size=audera.BUFFER_SIZE
+            )
         )
 
-        # Initialize time synchronization
-        self.rtt: float = 0.0
-
-        # Initialize process control parameters
-        self.mdns_broadcaster_event: asyncio.Event = asyncio.Event()
-        self.sync_event: asyncio.Event = asyncio.Event()
-        self.buffer_event: asyncio.Event = asyncio.Event()
+        # Set the audio output event to allow for the audio streamer synchronization service to start
+        self.audio_output_event.set()
 
     async def shairport_sync_player(self):
         """ The async `micro-service` for the shairport-sync remote audio output player
@@ -124,10 +195,10 @@ class Service():
         If the operating system of the player is not compatible or the service fails to start, then
         the task completes without starting the shairport-sync service.
 
-        If the shairport-sync service is started successfully, then the task periodically checks
-        the status of the service, restarting the service continuously with `audera.TIME_OUT` until
-        the task is either cancelled by the event loop or cancelled manually through
-        `KeyboardInterrupt`.
+        If the shairport-sync service is started successfully, then the task monitors the status of
+        the service through systemd dbus signals, or periodically checks the status of the service
+        with `audera.TIME_OUT` when `dbus-next` is not installed, until the task is either cancelled
+        by the event loop or cancelled manually through `KeyboardInterrupt`.
         """
 
         while True:
@@ -182,28 +253,35 @@ class Service():
 
             try:
 
-                # Monitor the status of the shairport-sync service subprocess
-                while True:
-
-                    status_process = await asyncio.create_subprocess_exec(
-                        "systemctl", "is-active", "--quiet", "shairport-sync"
-                    )
-                    await status_process.wait()
+                # Monitor the status of the shairport-sync service through systemd dbus signals,
+                #   falling back to polling the status of the service when dbus is unavailable
 
-                    if status_process.returncode != 0:
+                if not await self.shairport_sync_watcher():
+                    loop = asyncio.get_running_loop()
+                    next_wake = loop.time()
+                    while True:
 
-                        # Logging
-                        self.logger.info(
-                            ''.join([
-                                "The shairport-sync service encountered",
-                                " an error, retrying in %.2f [sec.]." % (
-                                    audera.TIME_OUT
-                                )
-                            ])
+                        status_process = await asyncio.create_subprocess_exec(
+                            "systemctl", "is-active", "--quiet", "shairport-sync"
                         )
+                        await status_process.wait()
 
-                    # Wait, yielding to other tasks in the event loop
-                    await asyncio.sleep(audera.TIME_OUT)
+                        if status_process.returncode != 0:
+
+                            # Logging
+                            self.logger.info(
+                                ''.join([
+                                    "The shairport-sync service encountered",
+                                    " an error, retrying in %.2f [sec.]."
+                                ]),
+                                audera.TIME_OUT
+                            )
+
+                        # Wait until the next status check, accounting for the duration of the
+                        #   status check, yielding to other tasks in the event loop
+
+                        next_wake = max(next_wake + audera.TIME_OUT, loop.time())
+                        await asyncio.sleep(next_wake - loop.time())
 
             except (
                 asyncio.CancelledError,  # Player services cancelled
@@ -223,37 +301,140 @@ class Service():
                 # Exit the loop
                 break
 
+    async def shairport_sync_watcher(self) -> bool:
+        """ Monitors the status of the shairport-sync service by subscribing to the systemd
+        `PropertiesChanged` dbus signal of the `shairport-sync.service` unit, restarting the unit
+        when the service fails. Returns `False` when the optional `dbus-next` dependency is not
+        installed or the system bus is unavailable, otherwise monitors the service until the task
+        is cancelled.
+        """
+
+        if MessageBus is None:
+            return False
+
+        # Connect to the systemd unit of the shairport-sync service
+        try:
+            bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        except (OSError, DBusError) as e:
+
+            # Logging
+            self.logger.warning(
+                '[%s] [shairport_sync_watcher()] %s.' % (
+                    type(e).__name__, str(e)
+                )
+            )
+
+            return False
+
+        try:
+            introspection = await bus.introspect('org.freedesktop.systemd1', '/org/freedesktop/systemd1')
+            manager = bus.get_proxy_object(
+                'org.freedesktop.systemd1',
+                '/org/freedesktop/systemd1',
+                introspection
+            ).get_interface('org.freedesktop.systemd1.Manager')
+
+            # Systemd only emits unit signals to subscribed clients
+            await manager.call_subscribe()
+
+            unit_path = await manager.call_get_unit('shairport-sync.service')
+            introspection = await bus.introspect('org.freedesktop.systemd1', unit_path)
+            properties = bus.get_proxy_object(
+                'org.freedesktop.systemd1',
+                unit_path,
+                introspection
+            ).get_interface('org.freedesktop.DBus.Properties')
+
+            # Queue the active state of the service on every state transition
+            states: asyncio.Queue = asyncio.Queue()
+
+            def on_properties_changed(interface: str, changed: dict, invalidated: list):
+                if interface == 'org.freedesktop.systemd1.Unit' and 'ActiveState' in changed:
+                    states.put_nowait(changed['ActiveState'].value)
+
+            properties.on_properties_changed(on_properties_changed)
+
+            # Wait for state transitions, yielding to other tasks in the event loop
+            while True:
+                state = await states.get()
+
+                if state in ['failed', 'inactive']:
+
+                    # Logging
+                    self.logger.info(
+                        'The shairport-sync service encountered an error, state {%s}.' % (
+                            state
+                        )
+                    )
+
+                # Restart the failed service through systemd, without spawning `systemctl`
+                if state == 'failed':
+                    try:
+                        await manager.call_restart_unit('shairport-sync.service', 'replace')
+
+                        # Logging
+                        self.logger.info(
+                            'The shairport-sync service was restarted.'
+                        )
+
+                    except DBusError as e:
+
+                        # Logging
+                        self.logger.warning(
+                            '[%s] [shairport_sync_watcher()] %s.' % (
+                                type(e).__name__, str(e)
+                            )
+                        )
+
+        except DBusError as e:
+
+            # Logging
+            self.logger.warning(
+                '[%s] [shairport_sync_watcher()] %s.' % (
+                    type(e).__name__, str(e)
+                )
+            )
+
+            return False
+
+        finally:
+
+            # Close the system bus connection
+            bus.disconnect()
+
     async def audera_player(self):
         """ The async `micro-service` for the audera remote audio output player service that
         supports audio receiving, playback, and synchronization from / with `audera` streamers.
 
-        The player attempts to start the audio streamer synchronization service, audio stream receiver
-        service, and playback service as _dependent_ tasks together.
+        The player starts the audio output initializer, mDNS broadcaster, audio streamer synchronization
+        server, audio stream receiver server, and playback service as _dependent_ tasks of a single task
+        group. Each service waits on the events of the services it depends on, and the servers serve
+        connections with audio streamers until the tasks are either cancelled by the event loop or
+        cancelled manually through `KeyboardInterrupt`.
 
-        If all services complete successfully or lose connection to the audio streamer, then the event
-        loop periodically attempts to reconnect to the audio streamer, restarting the services continuously
-        with `audera.TIME_OUT` until the tasks are either cancelled by the event loop or cancelled
-        manually through `KeyboardInterrupt`.
+        If any service raises an exception, then the task group cancels the remaining services and the
+        exception is propagated.
         """
 
-        # Schedule the mDNS broadcaster service
-        mdns_broadcaster = asyncio.create_task(self.mdns_broadcaster())
+        # Run the services as a task group, cancelling the remaining services as soon as any
+        #   service raises an exception
 
-        # Schedule the audio stream synchronizer server
-        streamer_synchronizer = asyncio.create_task(self.streamer_synchronizer())
+        async with asyncio.TaskGroup() as services:
 
-        # Schedule the audio stream receiver server
-        audio_receiver = asyncio.create_task(self.audio_receiver())
+            # Schedule the audio output initializer service
+            services.create_task(self.audio_output_initializer())
 
-        # Schedule the audio stream playback service
-        audio_playback = asyncio.create_task(self.audio_playback())
+            # Schedule the mDNS broadcaster service
+            services.create_task(self.mdns_broadcaster())
 
-        await asyncio.gather(
-            mdns_broadcaster,
-            streamer_synchronizer,
-            audio_receiver,
-            audio_playback
-        )
+            # Schedule the audio stream synchronizer server
+            services.create_task(self.streamer_synchronizer())
+
+            # Schedule the audio stream receiver server
+            services.create_task(self.audio_receiver())
+
+            # Schedule the audio stream playback service
+            services.create_task(self.audio_playback())
 
     async def mdns_broadcaster(self):
         """ Multi-cast DNS remote audio output player service broadcaster.
@@ -275,17 +456,34 @@ class Service():
 
             self.mdns_broadcaster_event.set()
 
-            # Update the mDNS parameters with the latest player attributes continuously
+            # Update the mDNS parameters with the latest player attributes continuously, reading
+            #   the player configuration only when the configuration file has been modified
+
+            loop = asyncio.get_running_loop()
+            next_wake = loop.time()
+            modified = None
             while self.mdns_broadcaster_event.is_set():
 
-                # Get the latest player attributes
-                self.player: audera.struct.player.Player = audera.dal.players.get_player(self.player.uuid)
+                last_modified = audera.dal.players.modified(self.player.uuid)
+                if modified != last_modified:
+                    modified = last_modified
 
-                # Update the mDNS service
-                self.mdns.update(self.player)
+                    # Get the latest player attributes, reading the configuration file outside of
+                    #   the event loop
+                    self.player: audera.struct.player.Player = await asyncio.to_thread(
+                        audera.dal.players.get_player,
+                        self.player.uuid
+                    )
 
-                # Wait, yielding to other tasks in the event loop
-                await asyncio.sleep(audera.TIME_OUT)
+                    # Update the mDNS service, only re-publishing the service information when the
+                    #   attributes of the player differ from the broadcasted player
+                    await self.mdns.update(self.player)
+
+                # Wait until the next update, accounting for the duration of the update, yielding
+                #   to other tasks in the event loop
+
+                next_wake = max(next_wake + audera.TIME_OUT, loop.time())
+                await asyncio.sleep(next_wake - loop.time())
 
         except (
             asyncio.CancelledError,  # mDNS-services cancelled
@@ -302,7 +500,7 @@ class Service():
         finally:
 
             # Close the mDNS service broadcaster
-            self.mdns.unregister()
+            await self.mdns.unregister()
 
             # Stop all services
             await self.stop_services()
@@ -318,32 +516,33 @@ class Service():
         connections with audio streamers forever until the task completes, is cancelled by the event
         loop or is cancelled manually through `KeyboardInterrupt`.
 
-        The audio streamer synchronizer depends on the mDNS broadcaster.
+        The audio streamer synchronizer depends on the mDNS broadcaster and the audio output initializer.
         """
 
-        # Wait for the mDNS broadcaster
+        # Wait for the mDNS broadcaster and the audio output
         await self.mdns_broadcaster_event.wait()
+        await self.audio_output_event.wait()
 
-        # Communicate with the audio streamer until the mDNS broadcaster is cancelled by the event loop
-        #   or cancelled manually through `KeyboardInterrupt`
+        # Initialize the audio streamer synchronizer once, retaining the listening socket for
+        #   the lifetime of the service
 
-        while self.mdns_broadcaster_event.is_set():
+        self.streamer_synchronizer_server = await asyncio.start_server(
+            client_connected_cb=(
+                lambda reader, writer: self.streamer_synchronizer_callback(
+                    reader=reader,
+                    writer=writer
+                )
+            ),
+            host='0.0.0.0',  # No specific destination address
+            port=audera.PING_PORT,
+            reuse_address=True  # Re-bind immediately on restart, without sharing the port
+        )
 
-            # Initialize the audio streamer synchronizer
-            streamer_synchronizer = await asyncio.start_server(
-                client_connected_cb=(
-                    lambda reader, writer: self.streamer_synchronizer_callback(
-                        reader=reader,
-                        writer=writer
-                    )
-                ),
-                host='0.0.0.0',  # No specific destination address
-                port=audera.PING_PORT
-            )
+        # Communicate with the audio streamer until the mDNS broadcaster is cancelled by the event loop
+        #   or cancelled manually through `KeyboardInterrupt`
 
-            # Serve streamer connections forever
-            async with streamer_synchronizer:
-                await asyncio.gather(streamer_synchronizer.serve_forever())
+        async with self.streamer_synchronizer_server:
+            await self.streamer_synchronizer_server.serve_forever()
 
     async def streamer_synchronizer_callback(
         self,
@@ -366,6 +565,26 @@ class Service():
         # Retrieve the audio streamer ip-address
         streamer_address, _ = writer.get_extra_info('peername')
 
+        # Configure the synchronization socket options for low-latency communication, prioritizing
+        #   the synchronization traffic on the host and on the local network
+        try:
+            sync_socket: socket.socket = writer.get_extra_info('socket')
+            sync_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+                sync_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            if hasattr(socket, 'SO_PRIORITY'):  # Linux only
+                sync_socket.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, audera.SOCKET_PRIORITY)
+            sync_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, audera.TYPE_OF_SERVICE)
+
+        except OSError:
+
+            # Logging
+            self.logger.warning(
+                'Audio streamer {%s} unable to synchronize with low-latency socket options.' % (
+                    streamer_address
+                )
+            )
+
         # Manage the audio playback session and audio streamer connection
         if self.playback_session.streamer_connection.streamer_address != streamer_address:
 
@@ -379,21 +598,21 @@ class Service():
             # Retain the latest audio streamer ip-address
             await self.playback_session.attach_streamer(streamer_address)
 
+            # Reset the round-trip time (rtt) of the previous audio streamer
+            self.rtt = 0.0
+
         # Communicate with the audio streamer
         try:
 
             # Record the local start-time of time synchronization with the audio streamer
-            #   as the timestamp of the request packet transmission, `t1`
+            #   as the timestamp of the request packet transmission, `t1`. The local times are
+            #   recorded with the monotonic clock, which cannot jump backward, so that the time
+            #   offset maps the streamer time directly onto the monotonic clock of the playback stream.
 
-            t1 = time.time()
+            t1 = time.monotonic()
 
             # Send the audio streamer the local start-time
-            writer.write(
-                struct.pack(
-                    "d",
-                    t1
-                )
-            )  # 8 bytes
+            writer.write(_TIME.pack(t1))  # 8 bytes
             await writer.drain()
 
             # Read the network times from the audio streamer for calculating the time offset
@@ -405,23 +624,40 @@ class Service():
             # Record the local end-time of time synchronization with the audio streamer
             #   as the timestamp of the response packet reception, `t4`
 
-            t4 = time.time()
+            t4 = time.monotonic()
 
             # Unpack the network times from the audio streamer
-            t2, t3 = struct.unpack("!dd", packet)
+            t2, t3 = _TIMES.unpack(packet)
+
+            # Calculate the player local machine time offset from the audio streamer and the
+            #   round-trip time (rtt), excluding the processing time on the audio streamer
 
-            # Update the player local machine time offset from the audio streamer
-            self.audio_output.time_offset = ((t2 - t1) + (t3 - t4)) / 2
+            offset = ((t2 - t1) + (t3 - t4)) / 2
+            rtt = (t4 - t1) - (t3 - t2)
 
-            # Update the round-trip time (rtt)
-            self.rtt = (t4 - t1) - (t3 - t2)
+            # Update the time offset and the round-trip time (rtt). The error of the time offset is
+            #   bounded by half of the round-trip time (rtt), so a synchronization with a high
+            #   round-trip time (rtt) does not replace the time offset of a previous synchronization,
+            #   unless its round-trip time (rtt) is no worse than the retained synchronization, so
+            #   that a high round-trip time (rtt) first synchronization is replaced by better ones.
+
+            if not self.rtt or rtt <= audera.HIGH_RTT or rtt <= self.rtt:
+                self.audio_output.time_offset = offset
+                self.rtt = rtt
+            else:
+
+                # Logging
+                self.logger.warning(
+                    'Discarded the synchronization with audio streamer {%s} with round-trip time (rtt) %.4f [sec.].',
+                    streamer_address,
+                    rtt
+                )
 
             # Respond to the audio streamer with the audio streamer offset time on the remote audio output
             #   player and wait for the response to be received.
 
             writer.write(
-                struct.pack(
-                    "!dd",
+                _TIMES.pack(
                     self.audio_output.time_offset,
                     self.rtt
                 )
@@ -431,23 +667,23 @@ class Service():
             # Logging
             self.logger.info(
                 ''.join([
-                    'Remote audio output player synchronized with audio streamer {%s}' % (
-                        streamer_address
-                    ),
-                    ' with round-trip time (rtt) %.4f [sec.] and time offset %.7f [sec.].' % (
-                        self.rtt,
-                        self.audio_output.time_offset
-                    )
-                ])
+                    'Remote audio output player synchronized with audio streamer {%s}',
+                    ' with round-trip time (rtt) %.4f [sec.] and time offset %.7f [sec.].'
+                ]),
+                streamer_address,
+                self.rtt,
+                self.audio_output.time_offset
             )
 
-            # Set the audio streamer synchronizer event to allow for the audio stream capture
-            #   and playback services to start.
+            # Set the audio streamer synchronizer event to allow for the audio stream receiver to
+            #   start after the first synchronization. The audio stream receiver is started once,
+            #   so the event remains set for the lifetime of the service.
 
             self.sync_event.set()
 
         except (
             asyncio.TimeoutError,  # Streamer communication timed-out
+            asyncio.IncompleteReadError,  # Streamer disconnected during a read
             ConnectionResetError,  # Streamer disconnected
             ConnectionAbortedError  # Streamer aborted the connection
         ):
@@ -461,7 +697,6 @@ class Service():
 
         except (
             asyncio.CancelledError,  # Player services cancelled
-            asyncio.IncompleteReadError,  # Player incomplete read
             KeyboardInterrupt  # Player services cancelled manually
         ):
 
@@ -496,9 +731,6 @@ class Service():
             ):
                 pass
 
-            # Stop synchronization and playback services
-            self.sync_event.clear()
-
     async def audio_receiver(self):
         """ The async server for audio receiving and buffering.
 
@@ -512,107 +744,72 @@ class Service():
         # Wait for the audio streamer synchronizer
         await self.sync_event.wait()
 
-        # Receive the audio stream from the audio streamer until the streamer synchronizer is cancelled by
-        #   the event loop or cancelled manually through `KeyboardInterrupt`
+        # Initialize the audio receiver once, retaining the listening socket for the lifetime
+        #   of the service
 
-        while self.sync_event.is_set():
+        # Each audio stream connection is served by an `AudioReceiver` protocol that receives the
+        #   audio stream packets directly into re-used receive buffers, rather than through the internal
+        #   buffer of an `asyncio.StreamReader`.
 
-            # Initialize the audio receiver
-            audio_receiver = await asyncio.start_server(
-                client_connected_cb=(
-                    lambda reader, writer: self.audio_receiver_callback(
-                        reader=reader,
-                        writer=writer
-                    )
-                ),
-                host='0.0.0.0',  # No specific destination address
-                port=audera.STREAM_PORT
-            )
+        self.audio_receiver_server = await asyncio.get_running_loop().create_server(
+            protocol_factory=lambda: AudioReceiver(service=self),
+            host='0.0.0.0',  # No specific destination address
+            port=audera.STREAM_PORT,
+            reuse_address=True  # Re-bind immediately on restart, without sharing the port
+        )
 
-            # Serve streamer connections forever
-            async with audio_receiver:
-                await asyncio.gather(audio_receiver.serve_forever())
+        # Configure the receive buffer of the listening sockets, inherited by every accepted audio
+        #   stream connection, so that bursts of audio stream packets do not stall the tcp window
 
-    async def audio_receiver_callback(
-        self,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter
-    ):
-        """ The async audio receiver callback that is started when an audio streamer connects
-        to `https://0.0.0.0:{audera.STREAM_PORT}`.
-
-        Parameters
-        ----------
-        reader: `asyncio.StreamReader`
-            The asynchronous network stream reader passed from `asyncio.start_server()` used to
-                receive the audio stream from the audio streamer.
-        writer: `asyncio.StreamWriter`
-            The unused asynchronous network stream writer passed from `asyncio.start_server()`.
-        """
-
-        # Retrieve the streamer ip-address
-        streamer_address, _ = writer.get_extra_info('peername')
+        for server_socket in self.audio_receiver_server.sockets:
+            server_socket.setsockopt(
+                socket.SOL_SOCKET,
+                socket.SO_RCVBUF,
+                audera.RECEIVE_BUFFER_SIZE
+            )
 
-        # Retain the latest playback session
-        await self.playback_session.attach_stream_writer(streamer_address, writer)
+        # Receive the audio stream from the audio streamer until the streamer synchronizer is cancelled by
+        #   the event loop or cancelled manually through `KeyboardInterrupt`
 
-        # Receive audio stream
         try:
-            while self.playback_session.streamer_connection.streamer_address == streamer_address:
-
-                # Parse audio stream packet
-                packet = await reader.readuntil(
-                    separator=(
-                        audera.PACKET_TERMINATOR  # 4 bytes
-                        + audera.NAME.encode()  # 6 bytes
-                        + audera.PACKET_ESCAPE  # 1 byte
-                        + audera.PACKET_ESCAPE  # 1 byte
-                    )
-                )
-
-                # Add audio stream packet to the buffer
-                await self.audio_output.buffer.put(packet)
-
-                # Trigger audio stream playback
-                self.buffer_event.set()
-
-        except (
-            asyncio.TimeoutError,  # Streamer communication timed-out
-            ConnectionResetError,  # Streamer disconnected
-            ConnectionAbortedError  # Streamer aborted the connection
-        ):
-
-            # Logging
-            self.logger.info(
-                'Audio streamer {%s} disconnected.' % (
-                    streamer_address
-                )
-            )
+            async with self.audio_receiver_server:
+                await self.audio_receiver_server.serve_forever()
 
         except (
             asyncio.CancelledError,  # Player services cancelled
-            asyncio.IncompleteReadError,  # Player incomplete read
             KeyboardInterrupt  # Player services cancelled manually
         ):
 
             # Logging
             self.logger.info(
-                ''.join([
-                    'The audio stream from audio streamer',
-                    ' {%s} was cancelled.' % (
-                        streamer_address
-                    )
-                ])
+                'The audio receiver was cancelled.'
             )
 
         finally:
 
-            # Close the playback session
+            # Close the audio stream connection of the playback session
             await self.playback_session.close()
 
-            # Reset the buffer and the buffer event
-            self.audio_output.clear_buffer()
-            self.buffer_event.clear()
+    def create_playback_session_task(self, coro) -> asyncio.Task:
+        """ Schedules a playback session coroutine as a task, retaining the task until it completes
+        and logging the exception of the task.
+
+        Parameters
+        ----------
+        coro: `Coroutine`
+            The playback session coroutine.
+        """
+        task = asyncio.get_running_loop().create_task(coro)
+        self.playback_session_tasks.add(task)
+        task.add_done_callback(self.playback_session_tasks.discard)
+        task.add_done_callback(self.service_callback)
+        return task
+
+    async def close_playback_session(self):
+        """ Closes the playback session and resets the buffer and the buffer event. """
+        await self.playback_session.close()
+        self.audio_output.clear_buffer()
+        self.buffer_event.clear()
 
     async def audio_playback(self):
         """ Plays a timestamped audio stream packet from the playback buffer, discarding incomplete
@@ -628,16 +825,18 @@ class Service():
         await self.buffer_event.wait()
 
         # Logging
+        interface = self.audio_output.interface
+        device = self.audio_output.device
         self.logger.info(
             ' '.join([
                 "Playing {%s}-bit audio at {%s}" % (
-                    self.audio_output.interface.bit_rate,
-                    self.audio_output.interface.rate
+                    interface.bit_rate,
+                    interface.rate
                 ),
                 "with {%s} channel(s) through output device {%s (%s)}." % (
-                    self.audio_output.interface.channels,
-                    self.audio_output.device.name,
-                    self.audio_output.device.index
+                    interface.channels,
+                    device.name,
+                    device.index
                 )
             ])
         )
@@ -648,39 +847,55 @@ class Service():
         # Play the audio stream from the playback buffer until audio playback is cancelled
         #   by the event loop or cancelled manually through `KeyboardInterrupt`
 
-        self.audio_output.play()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self.audio_executor, self.audio_output.play)
 
         # Manage / update the parameters of the digital audio stream
         try:
+            modified = None
             while True:
 
                 # The `update` method opens a new audio stream with an updated interface and
                 #   device settings and returns `True` when the stream is updated, closing the
                 #   previous audio stream. If the interface and device settings are unchanged
-                #   then the previous audio stream is retained.
+                #   then the previous audio stream is retained. Reading the configuration files and
+                #   opening the audio stream are blocking, so both run outside of the event loop,
+                #   and only when either configuration file has been modified.
 
-                if self.audio_output.update(
-                    interface=audera.dal.interfaces.get_interface(),
-                    device=audera.dal.devices.get_device('output')
-                ):
+                last_modified = (
+                    audera.dal.interfaces.modified(),
+                    audera.dal.devices.modified('output')
+                )
+                if modified != last_modified:
+                    modified = last_modified
 
-                    # Logging
-                    self.logger.info(
-                        ' '.join([
-                            "Playing {%s}-bit audio at {%s}" % (
-                                self.audio_output.interface.bit_rate,
-                                self.audio_output.interface.rate
-                            ),
-                            "with {%s} channel(s) through output device {%s (%s)}." % (
-                                self.audio_output.interface.channels,
-                                self.audio_output.device.name,
-                                self.audio_output.device.index
-                            )
-                        ])
-                    )
+                    interface = await asyncio.to_thread(audera.dal.interfaces.get_interface)
+                    device = await asyncio.to_thread(audera.dal.devices.get_device, 'output')
 
-                # Yield to other tasks in the event loop
-                await asyncio.sleep(0)
+                    if await loop.run_in_executor(
+                        self.audio_executor,
+                        self.audio_output.update,
+                        interface,
+                        device
+                    ):
+
+                        # Logging
+                        self.logger.info(
+                            ' '.join([
+                                "Playing {%s}-bit audio at {%s}" % (
+                                    interface.bit_rate,
+                                    interface.rate
+                                ),
+                                "with {%s} channel(s) through output device {%s (%s)}." % (
+                                    interface.channels,
+                                    device.name,
+                                    device.index
+                                )
+                            ])
+                        )
+
+                # Wait, yielding to other tasks in the event loop
+                await asyncio.sleep(audera.DEVICE_POLL_INTERVAL)
 
         except OSError as e:  # All other streamer communication I / O errors
 
@@ -714,10 +929,13 @@ class Service():
             self.buffer_event.clear()
 
             # Stop the audio services
-            self.audio_output.stop()
+            await loop.run_in_executor(self.audio_executor, self.audio_output.stop)
 
     async def stop_services(self):
-        """ Stops the async tasks. """
+        """ Stops the async tasks and closes the audio streamer synchronizer and audio receiver servers. """
+        for server in [self.streamer_synchronizer_server, self.audio_receiver_server]:
+            if server is not None:
+                server.close()
         self.mdns_broadcaster_event.clear()
         self.sync_event.clear()
         self.buffer_event.clear()
@@ -733,44 +951,55 @@ class Service():
         # Schedule the `audera` player service
         audera_player = asyncio.create_task(self.audera_player())
 
-        services = [
+        # Log the exception of any service as soon as the service completes, without waiting on
+        #   the remaining independent services
+
+        for service in [shairport_sync_player, audera_player]:
+            service.add_done_callback(self.service_callback)
+
+        # Run services, waiting for all services to complete
+        await asyncio.gather(
             shairport_sync_player,
-            audera_player
-        ]
+            audera_player,
+            return_exceptions=True
+        )
 
-        # Run services
-        try:
-            while services:
-                done, services = await asyncio.wait(
-                    services,
-                    return_when=asyncio.FIRST_COMPLETED
-                )
+    def service_callback(self, service: asyncio.Task):
+        """ Logs the exception of a completed service, logging each sub-exception of an exception
+        group raised by the task group of the `audera` player service.
 
-                done: set[asyncio.Task]
-                services: set[asyncio.Task]
+        Parameters
+        ----------
+        service: `asyncio.Task`
+            The completed service.
+        """
+        if service.cancelled() or not service.exception():
+            return
 
-                for service in done:
-                    if service.exception():
+        exceptions = [service.exception()]
+        while exceptions:
+            exception = exceptions.pop(0)
 
-                        # Logging
-                        self.logger.error(
-                            '[%s] [%s()] %s.' % (
-                                type(service.exception()).__name__,
-                                service.get_coro().__name__,
-                                service.exception()
-                            )
-                        )
+            # Unwrap the exception group, retaining the order of the sub-exceptions
+            if isinstance(exception, BaseExceptionGroup):
+                exceptions[:0] = exception.exceptions
+                continue
 
-        # Wait for services to complete
-        finally:
-            await asyncio.gather(
-                *services,
-                return_exceptions=True
+            # Logging
+            self.logger.error(
+                '[%s] [%s()] %s.' % (
+                    type(exception).__name__,
+                    service.get_coro().__name__,
+                    exception
+                )
             )
 
     async def run(self):
         """ Starts all async remote audio output player services. """
 
+        # Initialize the player service
+        await self.initialize()
+
         # Logging
         for line in audera.LOGO:
             self.logger.message(line)
@@ -787,3 +1016,240 @@ class Service():
 
         # Run services
         await self.start_services()
+
+
+class AudioReceiver(asyncio.BufferedProtocol):
+    """ A `class` that represents an audio stream connection with an audio streamer, receiving the
+    length-framed audio stream packets directly into re-used receive buffers.
+
+    Each complete audio data chunk is handed to the audio output as a `bytes` copy of the receive
+    buffer. The copy is required, PyAudio only accepts `bytes` from the audio playback callback and
+    rejects a `bytearray` or `memoryview`, and the receive buffer is overwritten by the next packet.
+
+    The audio receiver also acts as the stream writer of the playback session, so that the playback
+    session can close the audio stream connection.
+
+    Parameters
+    ----------
+    service: `audera.player.Service`
+        An instance of the `audera` player service.
+    """
+
+    def __init__(self, service: Service):
+        """ Initializes an instance of an audio stream connection.
+
+        Parameters
+        ----------
+        service: `audera.player.Service`
+            An instance of the `audera` player service.
+        """
+        self.service: Service = service
+        self.transport: Union[asyncio.Transport, None] = None
+        self.streamer_address: Union[str, None] = None
+        self.closed: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.resume_handle: Union[asyncio.TimerHandle, None] = None
+
+        # Initialize the receive buffers
+
+        # The audio stream packet header, containing the length of the audio data chunk and the
+        #   playback time, is received first and then the audio data chunk is received by length.
+        #   Each receive only requests the remaining bytes of the packet, so the socket is never
+        #   read beyond the end of a packet. Both buffers are re-used for every packet.
+
+        self.header: bytearray = bytearray(12)  # 12 bytes
+        self.chunk: bytearray = bytearray()
+        self.length: Union[int, None] = None  # The length of the audio data chunk being received
+        self.view: memoryview = memoryview(self.header)
+        self.received: int = 0
+
+    def get_extra_info(self, name: str, default=None):
+        """ Returns transport information about the audio stream connection.
+
+        Parameters
+        ----------
+        name: `str`
+            The name of the transport information.
+        default: `Any`
+            The value returned when the transport information is not available.
+        """
+        return self.transport.get_extra_info(name, default)
+
+    def connection_made(self, transport: asyncio.Transport):
+        """ Configures the audio stream connection and attaches it to the playback session.
+
+        Parameters
+        ----------
+        transport: `asyncio.Transport`
+            The transport of the audio stream connection.
+        """
+        self.transport = transport
+
+        # Retrieve the streamer ip-address
+        self.streamer_address, _ = transport.get_extra_info('peername')
+
+        # Configure the stream socket options for low-latency communication, detecting a
+        #   disconnected audio streamer with tcp keep-alive
+
+        try:
+            stream_socket: socket.socket = transport.get_extra_info('socket')
+            stream_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            stream_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'SO_PRIORITY'):  # Linux only
+                stream_socket.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, audera.SOCKET_PRIORITY)
+            stream_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, audera.TYPE_OF_SERVICE)
+
+        except OSError:
+
+            # Logging
+            self.service.logger.warning(
+                'Audio streamer {%s} unable to stream with low-latency socket options.',
+                self.streamer_address
+            )
+
+        # Retain the latest playback session
+        self.service.create_playback_session_task(
+            self.service.playback_session.attach_stream_writer(self.streamer_address, self)
+        )
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """ Returns the remaining bytes of the audio stream packet header or audio stream packet.
+
+        Parameters
+        ----------
+        sizehint: `int`
+            The recommended minimum size of the buffer.
+        """
+        return self.view[self.received:]
+
+    def buffer_updated(self, nbytes: int):
+        """ Buffers each audio stream packet once the audio stream packet is received.
+
+        Parameters
+        ----------
+        nbytes: `int`
+            The number of bytes received into the buffer.
+        """
+        self.received += nbytes
+        if self.received < len(self.view):
+            return
+
+        # Close the audio stream connection when the audio streamer is replaced
+        if self.service.playback_session.streamer_connection.streamer_address != self.streamer_address:
+            self.transport.close()
+            return
+
+        # Parse the audio stream packet header and receive the audio data chunk by length
+        if self.length is None:
+            length = _LENGTH.unpack_from(self.header, 0)[0]
+
+            # Close the audio stream connection before allocating an oversize packet, as the
+            #   length cannot exceed the length of the audio data chunk of the audio output
+
+            if length > self.service.audio_output.chunk_length:
+
+                # Logging
+                self.service.logger.warning(
+                    'Audio streamer {%s} sent an oversize packet of %d bytes.',
+                    self.streamer_address,
+                    length
+                )
+
+                self.transport.close()
+                return
+
+            self.length = length
+            if len(self.chunk) != length:
+                self.chunk = bytearray(length)
+            self.view = memoryview(self.chunk)
+            self.received = 0
+            if length:
+                return
+
+        # Reset the receive buffers for the next audio stream packet
+        length = self.length
+        playback_time = _TIME.unpack_from(self.header, 4)[0]
+        self.length = None
+        self.view = memoryview(self.header)
+        self.received = 0
+
+        # Discard incomplete packets, so that every buffered packet contains a complete audio
+        #   data chunk
+
+        audio_output = self.service.audio_output
+        if length != audio_output.chunk_length:
+
+            # Logging
+            self.service.logger.warning(
+                'Incomplete packet with playback time %.7f [sec.].',
+                playback_time
+            )
+
+            return
+
+        # Discard packets that are already late on arrival, rather than buffering them
+        #   ahead of packets that can still be played on-time
+
+        if playback_time - audio_output.time_offset < time.monotonic():
+            return
+
+        # Add the playback time and the audio data chunk to the buffer. The audio data chunk is
+        #   copied out of the re-used receive buffer into `bytes`, which is the only copy of the
+        #   audio data chunk on the player and the type that the audio playback callback returns
+        #   to PyAudio as-is.
+        audio_output.buffer.append((playback_time, bytes(self.chunk)))
+
+        # Trigger audio stream playback
+        self.service.buffer_event.set()
+
+        # Stop receiving while the buffer is full, leaving the audio stream packets in the
+        #   socket receive buffer until the audio playback stream consumes packets
+        if len(audio_output.buffer) >= audio_output.buffer_size:
+            self.transport.pause_reading()
+            self.resume_handle = asyncio.get_running_loop().call_later(
+                audio_output.chunk_duration,
+                self.resume_reading
+            )
+
+    def resume_reading(self):
+        """ Resumes receiving once the audio playback stream consumes packets from the buffer. """
+        audio_output = self.service.audio_output
+        if len(audio_output.buffer) >= audio_output.buffer_size:
+            self.resume_handle = asyncio.get_running_loop().call_later(
+                audio_output.chunk_duration,
+                self.resume_reading
+            )
+        else:
+            self.resume_handle = None
+            self.transport.resume_reading()
+
+    def connection_lost(self, exc: Union[Exception, None]):
+        """ Closes the playback session when the audio streamer disconnects.
+
+        Parameters
+        ----------
+        exc: `Exception`
+            The exception that closed the audio stream connection, or `None` when the audio stream
+                connection was closed normally.
+        """
+        if self.resume_handle is not None:
+            self.resume_handle.cancel()
+
+        # Logging
+        self.service.logger.info(
+            'Audio streamer {%s} disconnected.',
+            self.streamer_address
+        )
+
+        self.closed.set_result(None)
+
+        # Close the playback session and reset the buffer and the buffer event
+        if self.service.playback_session.streamer_connection.stream_writer is self:
+            self.service.create_playback_session_task(self.service.close_playback_session())
+
+    def close(self):
+        """ Closes the audio stream connection. """
+        self.transport.close()
+
+    async def wait_closed(self):
+        """ Waits until the audio stream connection is closed. """
+        await self.closed
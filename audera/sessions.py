@@ -61,7 +61,8 @@ class PlayerConnection():
                 await self.stream_writer.wait_closed()
             except (
                 ConnectionResetError,  # Player disconnected
-                ConnectionAbortedError  # Player aborted the connection
+                ConnectionAbortedError,  # Player aborted the connection
+                OSError  # All other player communication I / O errors
             ):
                 pass
 
@@ -95,7 +96,7 @@ class Stream():
     @property
     def num_players(self) -> int:
         """ Returns the number of attached remote audio output players as an `int`. """
-        return len(self.player_connections.keys())
+        return len(self.player_connections)
 
     def attach_player(
         self,
@@ -145,7 +146,7 @@ class Stream():
                 )
 
                 # Close the remote audio output player connection
-                await asyncio.gather(self.player_connections.get(player.address).disconnect())
+                await self.player_connections[player.address].disconnect()
 
                 # Remove the remote audio output player connection
                 del self.player_connections[player.address]
@@ -1,16 +1,22 @@
 """ Streamer service """
 
+from typing import Union, Dict, Set
 import ntplib
 import asyncio
 import socket
 import time
 import struct
-import copy
+import concurrent.futures
 from zeroconf import Zeroconf
 # import statistics
 
 import audera
 
+# Packet structures
+_LENGTH = struct.Struct(">I")  # The length of the audio data chunk, 4 bytes
+_PLAYBACK_TIME = struct.Struct("d")  # The playback time of the audio data chunk, 8 bytes
+_TIMES = struct.Struct("!dd")  # The time synchronization response, 16 bytes
+
 
 class Service():
     """ A `class` that represents the `audera` streamer service.
@@ -110,30 +116,87 @@ class Service():
         #   stream. The system default audio input device is automatically selected.
 
         self.audio_input = audera.devices.Input(
+            logger=self.logger,
             interface=audera.dal.interfaces.get_interface(),
-            device=audera.dal.devices.get_device('input')
+            device=audera.dal.devices.get_device('input'),
+            buffer_size=audera.BUFFER_SIZE
+        )
+
+        # Initialize the audio executor
+
+        # The audio stream is captured in PortAudio callback mode, on the PortAudio thread.
+        #   Re-opening and closing the audio stream block on the audio input device, so both run
+        #   on a single dedicated thread, so that the event loop continues to broadcast,
+        #   synchronize and browse.
+
+        self.audio_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='audera-audio'
         )
 
         # Initialize time synchronization
+
+        # The sum of the network time protocol (ntp) server offset and the playback delay is
+        #   retained as the playback offset, updated only when either changes, so that the playback
+        #   time of each audio data chunk is a single addition to the current time.
+
         self.ntp: audera.ntp.Synchronizer = audera.ntp.Synchronizer()
-        self.ntp_offset: float = 0.0
+        self._ntp_offset: float = 0.0
+        self._playback_delay: float = audera.PLAYBACK_DELAY
+        self._playback_offset: float = self._ntp_offset + self._playback_delay
 
-        # Initialize playback delay and rtt-history
-        self.playback_delay: float = audera.PLAYBACK_DELAY
+        # Initialize rtt-history
         self.rtt_history: list[float] = []
 
+        # Initialize the player streamers
+
+        # Each attached remote audio output player is served by its own player streamer task from a
+        #   bounded packet queue, so that a slow player only drops its own oldest packets rather
+        #   than delaying the broadcast to every other player.
+
+        self.player_queues: Dict[str, asyncio.Queue] = {}
+        self.player_streamers: Set[asyncio.Task] = set()
+
         # Initialize process control parameters
         self.mdns_browser_event: asyncio.Event = asyncio.Event()
 
+    @property
+    def ntp_offset(self) -> float:
+        """ The network time protocol (ntp) server offset in seconds. """
+        return self._ntp_offset
+
+    @ntp_offset.setter
+    def ntp_offset(self, value: float):
+        self._ntp_offset = value
+        self._playback_offset = value + self._playback_delay
+
+    @property
+    def playback_delay(self) -> float:
+        """ The playback delay in seconds. """
+        return self._playback_delay
+
+    @playback_delay.setter
+    def playback_delay(self, value: float):
+        self._playback_delay = value
+        self._playback_offset = self._ntp_offset + value
+
     def get_streamer_time(self) -> float:
         """ Returns the network time protocol (ntp) synchronized time on the streamer. """
-        return time.time() + self.ntp_offset
+        return time.time() + self._ntp_offset
 
-    def get_playback_time(self) -> float:
-        """ Returns the playback time based on the current time, playback delay and
-        network time protocol (ntp) server offset.
+    def get_playback_time(self, capture_time: Union[float, None] = None) -> float:
+        """ Returns the playback time based on the capture time, or the current time, playback delay
+        and network time protocol (ntp) server offset.
+
+        Parameters
+        ----------
+        capture_time: `Union[float, None]`
+            The local machine time in seconds since the epoch at which the audio data chunk was
+                captured. When `None`, the current time is used.
         """
-        return self.get_streamer_time() + self.playback_delay
+        if capture_time is None:
+            capture_time = time.time()
+        return capture_time + self._playback_offset
 
     async def ntp_synchronizer(self):
         """ The async `micro-service` for network time protocol (ntp) synchronization.
@@ -151,8 +214,10 @@ class Service():
             while True:
                 try:
 
-                    # Update the local machine time offset from the network time protocol (ntp) server
-                    self.ntp_offset = self.ntp.offset()
+                    # Update the local machine time offset from the network time protocol (ntp) server,
+                    #   requesting the offset asynchronously so that the audio stream is not blocked
+                    #   while the ntp server responds
+                    self.ntp_offset = await self.ntp.async_offset(time_out=audera.TIME_OUT)
 
                     # Logging
                     self.logger.info(
@@ -164,7 +229,10 @@ class Service():
                     # Wait, yielding to other tasks in the event loop
                     await asyncio.sleep(audera.SYNC_INTERVAL)
 
-                except ntplib.NTPException:
+                except (
+                    ntplib.NTPException,  # The ntp server did not respond
+                    OSError  # The ntp server could not be resolved or reached
+                ):
 
                     # Logging
                     self.logger.info(
@@ -193,6 +261,11 @@ class Service():
                 )
             )
 
+        finally:
+
+            # Close the ntp client socket
+            self.ntp.close()
+
     async def mdns_browser(self):
         """ The async `micro-service` for the multi-cast DNS remote audio output player service
         browser.
@@ -216,6 +289,12 @@ class Service():
             # Update the playback session, opening connections to all remote audio
             #   output players attached to the session continuously
 
+            # While no remote audio output players are connected, the mDNS browser is refreshed
+            #   with an adaptive interval, starting fast and doubling after each empty scan, so
+            #   that the first player is discovered quickly without flooding an idle network.
+
+            discovery_interval = audera.MIN_DISCOVERY_INTERVAL
+
             while self.mdns_browser_event.is_set():
 
                 if self.mdns.players:
@@ -225,20 +304,23 @@ class Service():
                     #   concurrently
 
                     await self.synchronize()
+                    time_out = audera.TIME_OUT
+                    discovery_interval = audera.MIN_DISCOVERY_INTERVAL
 
                 else:
                     self.mdns.refresh()
+                    time_out = discovery_interval
+                    discovery_interval = min(discovery_interval * 2, audera.MAX_DISCOVERY_INTERVAL)
 
                     # Logging
                     self.logger.info(
-                        ''.join([
-                            "Waiting for remote audio output players to connect,",
-                            " retrying in %.2f [sec.]." % (audera.TIME_OUT)
-                        ])
+                        "Waiting for remote audio output players to connect, retrying in %.2f [sec.].",
+                        time_out
                     )
 
-                # Wait, yielding to other tasks in the event loop
-                await asyncio.sleep(audera.TIME_OUT)
+                # Wait until the remote audio output players change or the time-out elapses,
+                #   yielding to other tasks in the event loop
+                await self.mdns.wait(time_out)
 
         except (
             asyncio.CancelledError,  # mDNS-services cancelled
@@ -358,17 +440,16 @@ class Service():
             #   well as the timestamp of the response packet transmission, `t3`
 
             writer.write(
-                struct.pack(
-                    "!dd",
+                _TIMES.pack(
                     t2,
-                    (self.get_streamer_time())
+                    self.get_streamer_time()
                 )
             )  # 16 bytes
             await writer.drain()
 
             # Read the return response containing the time offset of the remote audio output player
             packet = await reader.readexactly(16)  # 16 bytes
-            player_offset, player_rtt = struct.unpack("!dd", packet)
+            player_offset, player_rtt = _TIMES.unpack(packet)
 
             # Logging
             self.logger.info(
@@ -511,55 +592,81 @@ class Service():
                 # Retain the remote audio output player for the current playback session
                 self.stream_session.attach_player(player=player, stream_writer=writer)
 
+                # Pause writing as soon as any data is pending in the transport, so that draining
+                #   the writer waits until each packet is handed to the kernel. Packets then wait in
+                #   the bounded player queue, where stale packets are dropped, rather than building
+                #   up in the transport buffer.
+
+                writer.transport.set_write_buffer_limits(high=0, low=0)
+
+                # Start streaming audio to the remote audio output player
+                queue = asyncio.Queue(audera.BUFFER_SIZE)
+                self.player_queues[player.address] = queue
+                player_streamer = asyncio.create_task(
+                    self.player_streamer(player=player, writer=writer, queue=queue)
+                )
+                self.player_streamers.add(player_streamer)
+                player_streamer.add_done_callback(self.player_streamers.discard)
+
                 # Logging
                 self.logger.info(
-                    'Streaming audio to remote audio output player {%s (%s)}.' % (
-                        player.name,
-                        player.short_uuid
-                    )
+                    'Streaming audio to remote audio output player {%s (%s)}.',
+                    player.name,
+                    player.short_uuid
                 )
 
-                # Configure the stream socket options for low-latency communication
+                # Configure the stream socket options for low-latency communication, bounding the
+                #   send buffer to the audio stream packets buffered by the remote audio output
+                #   player so that audio stream packets are not queued on the streamer, and marking
+                #   the audio stream as interactive traffic for the local queueing disciplines and
+                #   the network
+
                 try:
                     client_socket: socket.socket = writer.get_extra_info('socket')
-                    client_socket: socket.socket = socket.socket()
                     client_socket.setsockopt(
                         socket.IPPROTO_TCP,
                         socket.TCP_NODELAY,
                         1
                     )
+                    if hasattr(socket, 'SO_PRIORITY'):  # Linux only
+                        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, audera.SOCKET_PRIORITY)
+                    client_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, audera.TYPE_OF_SERVICE)
+                    client_socket.setsockopt(
+                        socket.SOL_SOCKET,
+                        socket.SO_SNDBUF,
+                        audera.BUFFER_SIZE * (
+                            12  # The length and playback time of the audio data chunk
+                            + self.audio_input.interface.chunk
+                            * self.audio_input.interface.channels
+                            * self.audio_input.interface.bit_rate // 8
+                        )
+                    )
 
-                except Exception:
+                except OSError:
 
                     # Logging
                     self.logger.warning(
-                        'Remote audio output player {%s (%s)} unable to operate with TCP_NODELAY.' % (
-                            player.name,
-                            player.short_uuid
-                        )
+                        'Remote audio output player {%s (%s)} unable to stream with low-latency socket options.',
+                        player.name,
+                        player.short_uuid
                     )
 
                 # Logging
                 self.logger.info(
-                    'Remote audio output player {%s (%s)} attached.' % (
-                        player.name,
-                        player.short_uuid
-                    )
+                    'Remote audio output player {%s (%s)} attached.',
+                    player.name,
+                    player.short_uuid
                 )
 
             except asyncio.TimeoutError:  # Player communication timed-out
 
                 # Logging
                 self.logger.info(
-                    ''.join([
-                        "Unable to stream audio to remote audio output player {%s (%s)}," % (
-                            player.name,
-                            player.short_uuid
-                        ),
-                        " retrying in %.2f [sec.]." % (
-                            audera.TIME_OUT
-                        )
-                    ])
+                    "Unable to stream audio to remote audio output player {%s (%s)},"
+                    " retrying in %.2f [sec.].",
+                    player.name,
+                    player.short_uuid,
+                    audera.TIME_OUT
                 )
 
     async def audio_streamer(self):
@@ -601,6 +708,24 @@ class Service():
         # Serve the audio stream until the mDNS browser is cancelled by the event loop or
         #   cancelled manually through `KeyboardInterrupt`
 
+        # Bind the attributes used for every audio data chunk to locals once, outside of the loop
+        loop = asyncio.get_running_loop()
+        audio_executor = self.audio_executor
+        read = self.audio_input.read
+        player_queues = self.player_queues
+        pack_playback_time = _PLAYBACK_TIME.pack
+        get_playback_time = self.get_playback_time
+
+        # The length prefix of the audio stream packets only changes with the audio stream
+        #   interface, so the packed length is retained until the audio data chunk size changes
+        chunk_length = 0
+        length = b''
+
+        # The interface and device configuration files are checked for modifications at most once
+        #   every device poll interval, rather than for every audio data chunk
+        next_check = loop.time()
+        modified = None
+
         try:
             while self.mdns_browser_event.is_set():
 
@@ -609,12 +734,34 @@ class Service():
                 # The `update` method opens a new audio stream with an updated interface and
                 #   device settings and returns `True` when the stream is updated, closing the
                 #   previous audio stream. If the interface and device settings are unchanged
-                #   then the previous audio stream is retained.
+                #   then the previous audio stream is retained. Reading the configuration files and
+                #   re-opening the audio stream are blocking, so both run outside of the event
+                #   loop, and only when either configuration file has been modified. Re-opening the
+                #   audio stream runs on the audio executor, so that the audio stream is never
+                #   closed during a read.
+
+                updated = False
+                now = loop.time()
+                if now >= next_check:
+                    next_check = now + audera.DEVICE_POLL_INTERVAL
+                    last_modified = (
+                        audera.dal.interfaces.modified(),
+                        audera.dal.devices.modified('input')
+                    )
+                    if modified != last_modified:
+                        modified = last_modified
 
-                if self.audio_input.update(
-                    interface=audera.dal.interfaces.get_interface(),
-                    device=audera.dal.devices.get_device('input')
-                ):
+                        interface = await asyncio.to_thread(audera.dal.interfaces.get_interface)
+                        device = await asyncio.to_thread(audera.dal.devices.get_device, 'input')
+
+                        updated = await loop.run_in_executor(
+                            audio_executor,
+                            self.audio_input.update,
+                            interface,
+                            device
+                        )
+
+                if updated:
 
                     # Logging
                     self.logger.info(
@@ -639,15 +786,12 @@ class Service():
 
                     await asyncio.sleep(audera.TIME_OUT)
 
-                # Retain the current connected remote audio output players for broadcasting
-                player_connections = copy.copy(self.stream_session.player_connections)
-
                 # Timout to allow for the remote audio output player buffers to empty
                 #   when a new player is attached since the previous broadcast. By allowing
                 #   the buffers to empty, no player will try to play pre-buffered audio out of
                 #   sync with the other players.
 
-                if len(player_connections.keys()) > previous_num_players:
+                if self.stream_session.num_players > previous_num_players:
 
                     # Logging
                     self.logger.info(
@@ -664,65 +808,32 @@ class Service():
                 # Update the number of remote audio output players
                 previous_num_players = self.stream_session.num_players
 
-                # Read the next audio data chunk from the audio stream
-                chunk = self.audio_input.stream.read(
-                    self.audio_input.interface.chunk,
-                    exception_on_overflow=False
-                )
-
-                # Convert the audio data chunk to a timestamped packet, including the length of
-                #   the packet as well as the packet terminator. Assign the timestamp as the target
-                #   playback time accounting for a fixed playback delay from the current time on
-                #   the streamer.
-
-                length = struct.pack(">I", len(chunk))
-                playback_time = struct.pack(
-                    "d",
-                    self.get_playback_time()
-                )
-                packet = (
-                    length  # 4 bytes
-                    + playback_time  # 8 bytes
-                    + chunk
-                    + audera.PACKET_TERMINATOR  # 4 bytes
-                    + audera.NAME.encode()  # 6 bytes
-                    + audera.PACKET_ESCAPE  # 1 byte
-                    + audera.PACKET_ESCAPE  # 1 byte
-                )
-
-                # Broadcast the packet to the players concurrently and drain the writer with timeout
-                #   for flow control, detaching any / all players that are too slow
-
-                results = await asyncio.gather(
-                    *[
-                        self.broadcast(
-                            writer=player_connection.stream_writer,
-                            packet=packet
-                        ) for player_connection in player_connections.values()
-                    ],
-                    return_exceptions=True
-                )
-
-                # Detach and disconnect players
-                for player, result in zip(
-                    [player_connection.player for player_connection in player_connections.values()],
-                    results
-                ):
-                    if result is False:
-
-                        # Detach and disconnect the remote audio output player
-                        await self.stream_session.detach_player(player)
-
-                        # Logging
-                        self.logger.info(
-                            'Remote audio output player {%s (%s)} detached.' % (
-                                player.name,
-                                player.short_uuid
-                            )
-                        )
-
-                # Yield to other tasks in the event loop
-                await asyncio.sleep(0)
+                # Wait for the next audio data chunk captured by the audio stream, yielding to other
+                #   tasks in the event loop whenever the capture buffer is empty. The capture buffer
+                #   is bounded, so the event loop is never held for more than a buffer of chunks.
+                capture_time, chunk = await read()
+
+                # Convert the audio data chunk to a timestamped packet, prefixed with the length of
+                #   the audio data chunk so that players can read each packet by length. Assign the
+                #   timestamp as the target playback time accounting for a fixed playback delay from
+                #   the capture time of the audio data chunk on the streamer, so that the time the
+                #   audio data chunk spent buffered is not added to the playback time. The length,
+                #   the playback time and the audio data chunk are kept as separate buffers and
+                #   written together, rather than copying the audio data chunk into a concatenated
+                #   packet.
+
+                if len(chunk) != chunk_length:
+                    chunk_length = len(chunk)
+                    length = _LENGTH.pack(chunk_length)  # 4 bytes
+                packet = (length, pack_playback_time(get_playback_time(capture_time)), chunk)  # 8 bytes
+
+                # Broadcast the packet to the players, dropping the oldest queued packet of any
+                #   player that has fallen behind to keep the latency of every player bounded
+
+                for queue in player_queues.values():
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(packet)
 
         except OSError as e:  # All other streamer communication I / O errors
 
@@ -748,52 +859,107 @@ class Service():
 
         finally:
 
-            # Close the audio stream
-            self.audio_input.stream.stop_stream()
-            self.audio_input.stream.close()
-            self.audio_input.port.terminate()
+            # Close the audio stream on the audio executor
+            await loop.run_in_executor(self.audio_executor, self.audio_input.stop)
 
-    async def broadcast(
+    async def player_streamer(
         self,
+        player: audera.struct.player.Player,
         writer: asyncio.StreamWriter,
-        packet: bytes
-    ) -> bool:
-        """ Broadcasts a timestamped audio stream packet to any / all connected remote audio output
-        players.
+        queue: asyncio.Queue
+    ):
+        """ Streams the timestamped audio stream packets broadcasted to a remote audio output player,
+        detaching the player when it disconnects.
 
         Parameters
         ----------
+        player: `audera.struct.player.Player`
+            An `audera.struct.player.Player` object.
         writer: `asyncio.StreamWriter`
             The asynchronous network stream writer registered to the player used to write the
                 audio stream to the player over a TCP connection.
-        packet: `bytes`
-            The timestamped audio data chunk.
+        queue: `asyncio.Queue`
+            The bounded queue of timestamped audio stream packets broadcasted to the player, each
+                as a tuple of the length, the playback time and the audio data chunk.
         """
 
-        # Broadcast the packet to the remote audio output player and drain the writer
-        #   with timeout for flow control
+        # Write the packets to the remote audio output player and drain the writer for flow control
+        get = queue.get
+        get_nowait = queue.get_nowait
+        writelines = writer.writelines
+        drain = writer.drain
+        get_write_buffer_size = writer.transport.get_write_buffer_size
+        is_closing = writer.transport.is_closing
 
         try:
-            writer.write(packet)
-            await writer.drain()
-            return True
+            while True:
+                packet = await get()
+
+                # Coalesce the packets that queued up while the player was draining into a single
+                #   write, so that a backlog is sent with one system call without delaying a packet
+                if queue.empty():
+                    writelines(packet)
+                else:
+                    packets = list(packet)
+                    while not queue.empty():
+                        packets.extend(get_nowait())
+                    writelines(packets)
+
+                # Drain the writer only when the packet is not fully handed to the kernel or the
+                #   connection is closing, so that a lost connection is still raised by the drain.
+                #   The drain is timed-out only on this slow path, so that no timer is scheduled for
+                #   packets that are handed to the kernel immediately.
+                if get_write_buffer_size() or is_closing():
+                    await asyncio.wait_for(drain(), timeout=audera.TIME_OUT)
 
         except (
-            asyncio.TimeoutError,  # Player communication timed-out
             ConnectionResetError,  # Player disconnected
-            ConnectionAbortedError  # Player aborted the connection
-        ):
-            return False
+            ConnectionAbortedError,  # Player aborted the connection
+            BrokenPipeError,  # Player closed the connection
+            asyncio.TimeoutError,  # Player stopped reading the audio stream
+            OSError  # All other player communication I / O errors
+        ) as e:
 
-        finally:
+            # Logging
+            if not isinstance(
+                e,
+                (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, asyncio.TimeoutError)
+            ):
+                self.logger.error(
+                    '[%s] [player_streamer()] %s.',
+                    type(e).__name__,
+                    e
+                )
 
-            # Close the connection
+            # Detach and disconnect the remote audio output player, so that the player is
+            #   re-connected by the next synchronization. When the player has already been
+            #   detached, or has since re-connected with a new stream writer, only the stream
+            #   writer of this player streamer is closed.
+
+            player_connection = self.stream_session.player_connections.get(player.address)
+            if player_connection and player_connection.stream_writer is writer:
+                await self.stream_session.detach_player(player)
+
+                # Logging
+                self.logger.info(
+                    'Remote audio output player {%s (%s)} detached.',
+                    player.name,
+                    player.short_uuid
+                )
 
-            # Typically the `async.StreamWriter` would be closed here, although the closing of the
-            #   writer actually occurs within the calling method as the writer is re-used for
-            #   broadcasting each and every audio stream packet
+            else:
+                writer.close()
+
+        except asyncio.CancelledError:  # Streamer services cancelled
             pass
 
+        finally:
+
+            # Stop broadcasting to the remote audio output player, unless the player has since
+            #   re-connected with a new stream writer
+            if self.player_queues.get(player.address) is queue:
+                del self.player_queues[player.address]
+
     async def stop_services(self):
         """ Stops the async tasks. """
         self.mdns_browser_event.clear()
@@ -812,40 +978,37 @@ class Service():
         # Schedule the audio stream service
         audio_streamer = asyncio.create_task(self.audio_streamer())
 
-        services = [
-            ntp_synchronizer,
-            mdns_browser,
-            audio_streamer
-        ]
+        # Log the exception of any service as soon as the service completes, without waiting on
+        #   the remaining services
 
-        # Run services
-        try:
-            while services:
-                done, services = await asyncio.wait(
-                    services,
-                    return_when=asyncio.FIRST_COMPLETED
-                )
+        for service in [ntp_synchronizer, mdns_browser, audio_streamer]:
+            service.add_done_callback(self.service_callback)
 
-                done: set[asyncio.Task]
-                services: set[asyncio.Task]
+        # Run services, waiting for all services to complete
+        await asyncio.gather(
+            ntp_synchronizer,
+            mdns_browser,
+            audio_streamer,
+            return_exceptions=True
+        )
 
-                for service in done:
-                    if service.exception():
+    def service_callback(self, service: asyncio.Task):
+        """ Logs the exception of a completed service.
 
-                        # Logging
-                        self.logger.error(
-                            '[%s] [%s()] %s.' % (
-                                type(service.exception()).__name__,
-                                service.get_coro().__name__,
-                                service.exception()
-                            )
-                        )
+        Parameters
+        ----------
+        service: `asyncio.Task`
+            The completed service.
+        """
+        if not service.cancelled() and service.exception():
 
-        # Wait for services to complete
-        finally:
-            await asyncio.gather(
-                *services,
-                return_exceptions=True
+            # Logging
+            self.logger.error(
+                '[%s] [%s()] %s.' % (
+                    type(service.exception()).__name__,
+                    service.get_coro().__name__,
+                    service.exception()
+                )
             )
 
     async def run(self):
@@ -205,22 +205,22 @@ class Device():
         # Open a temporary audio port
         _audio = pyaudio.PyAudio()
 
-        # Get the default audio input device
-        if type_.strip().lower() == 'input':
-            device_index = _audio.get_default_input_device_info()['index']
+        # Get the default audio device, the device information of the default device already
+        #   contains the name of the device, so the device list is not queried again
+        try:
+            if type_.strip().lower() == 'input':
+                device_info = _audio.get_default_input_device_info()
 
-        if type_.strip().lower() == 'output':
-            device_index = _audio.get_default_output_device_info()['index']
-
-        device_info = _audio.get_device_info_by_index(device_index)
-        name = device_info['name']
+            if type_.strip().lower() == 'output':
+                device_info = _audio.get_default_output_device_info()
 
         # Close the temporary audio port
-        _audio.terminate()
+        finally:
+            _audio.terminate()
 
         return Device(
-            name=name,
-            index=device_index,
+            name=device_info['name'],
+            index=device_info['index'],
             type=type_
         )
 
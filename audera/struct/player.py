@@ -113,11 +113,15 @@ class Player():
             An instance of the `zeroconf` multi-cast DNS service parameters.
         """
 
-        # Unpack the mDNS service info into a dictionary
-        properties = {
-            key.decode('utf-8'): value.decode('utf-8') if isinstance(value, bytes) else value
-            for key, value in info.properties.items()
-        }
+        # Unpack the mDNS service info into a dictionary, decoding only the keys and values that
+        #   have not already been decoded
+        properties = {}
+        for key, value in info.properties.items():
+            if isinstance(key, bytes):
+                key = key.decode('utf-8')
+            if isinstance(value, bytes):
+                value = value.decode('utf-8')
+            properties[key] = value
 
         return Player(
             name=utils.as_type(properties['name'], 'str'),